@@ -1,28 +1,25 @@
-from abc import ABC, abstractmethod
+import sys
+from typing import Protocol
 
-class Window(ABC):
+class Window(Protocol):
     """Interface representing a window UI component."""
-    @abstractmethod
     def get_bg_color(self) -> int:
         """
         Return the background color code for the window.
         """
 
-    @abstractmethod
     def get_title(self) -> str:
         """Returns the name text for the window."""
 
-class Text(ABC):
+class Text(Protocol):
     """Interface representing a text UI component."""
-    @abstractmethod
     def get_text_color(self) -> int:
         """Returns text color code."""
 
-    @abstractmethod
     def get_text(self) -> str:
         """Returns the content text."""
 
-class LightWindow(Window):
+class LightWindow:
     """Light-themed window implementation."""
     def get_bg_color(self) -> int:
         return 47 # White background
@@ -30,7 +27,7 @@ class LightWindow(Window):
     def get_title(self) -> str:
         return "Light Window"
 
-class DarkWindow(Window):
+class DarkWindow:
     """Dark-themed window implementation."""
     def get_bg_color(self) -> int:
         return 40 # Black background
@@ -38,7 +35,7 @@ class DarkWindow(Window):
     def get_title(self) -> str:
         return "Dark Window"
 
-class LightText(Text):
+class LightText:
     """Text component for light theme."""
     def get_text_color(self) -> int:
         return 34 # Blue text
@@ -46,7 +43,7 @@ class LightText(Text):
     def get_text(self) -> str:
         return "This is a light-themed interface."
 
-class DarkText(Text):
+class DarkText:
     """Text component for dark theme."""
     def get_text_color(self) -> int:
         return 36 # Cyan text
@@ -54,35 +51,47 @@ class DarkText(Text):
     def get_text(self) -> str:
         return "This is a dark-themed interface."
 
-class ThemeFactory(ABC):
+# Components are stateless, so each theme shares a single instance of them
+_LIGHT_WINDOW = LightWindow()
+_LIGHT_TEXT = LightText()
+_DARK_WINDOW = DarkWindow()
+_DARK_TEXT = DarkText()
+
+class ThemeFactory(Protocol):
     """Abstract factory for creating themed UI components."""
-    @abstractmethod
     def create_window(self) -> Window:
         """
         Creates and returns a themed window component.
         """
 
-    @abstractmethod
     def create_text(self) -> Text:
         """
         Creates and returns a themed text component.
         """
 
-class LightTheme(ThemeFactory):
+class LightTheme:
     """Factory for creating light-themed UI components."""
+    def __init__(self):
+        # Theme colors are constant, so the ANSI style prefix is built once
+        self._prefix = f"\033[{_LIGHT_TEXT.get_text_color()};{_LIGHT_WINDOW.get_bg_color()}m"
+
     def create_window(self) -> LightWindow:
-        return LightWindow()
+        return _LIGHT_WINDOW
 
     def create_text(self) -> LightText:
-        return LightText()
+        return _LIGHT_TEXT
     
-class DarkTheme(ThemeFactory):
+class DarkTheme:
     """Factory for creating dark-themed UI components."""
+    def __init__(self):
+        # Theme colors are constant, so the ANSI style prefix is built once
+        self._prefix = f"\033[{_DARK_TEXT.get_text_color()};{_DARK_WINDOW.get_bg_color()}m"
+
     def create_window(self) -> DarkWindow:
-        return DarkWindow()
+        return _DARK_WINDOW
 
     def create_text(self) -> DarkText:
-        return DarkText()
+        return _DARK_TEXT
 
 def render_ui(factory: ThemeFactory) -> None:
     """
@@ -90,15 +99,18 @@ def render_ui(factory: ThemeFactory) -> None:
     Applies text and background color using ANSI escape codes.
     
     :param factory: The theme factory to use for creating UI components.
-    :raises TypeError: If factory is not an instance of ThemeFactory
+    :raises TypeError: If factory does not provide the ThemeFactory interface
     """
-    if not isinstance(factory, ThemeFactory):
-        raise TypeError('Factory must be an instance of ThemeFactory')
+    if not hasattr(factory, 'create_window') or not hasattr(factory, 'create_text'):
+        raise TypeError('Factory must implement the ThemeFactory interface')
     window = factory.create_window()
     text = factory.create_text()
-    # Display window name and text with proper styling
-    print(f"\033[{text.get_text_color()};{window.get_bg_color()}m{window.get_title()}")
-    print(f"{text.get_text()}\033[0m")
+    # Use the factory's precomputed style prefix when available
+    prefix = getattr(factory, '_prefix', None)
+    if prefix is None:
+        prefix = f"\033[{text.get_text_color()};{window.get_bg_color()}m"
+    # Display window name and text with proper styling in a single write
+    sys.stdout.write(prefix + window.get_title() + "\n" + text.get_text() + "\033[0m\n")
   
 def main():
     """Demonstrates rendering with different themes.""" 
@@ -1,13 +1,61 @@
 from abc import ABC, abstractmethod
 from enum import Enum
 
+try:
+    import numpy as np
+except ImportError:
+    # numpy is optional, only batch_to_decimal() needs it
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional, the kernel then runs as plain Python
+    njit = None
+
+# Precomputed reciprocals for minutes and seconds conversion
+_INV60 = 1 / 60
+_INV3600 = 1 / 3600
+
+def _dms_kernel(degrees: int, minutes: int, seconds: int) -> float:
+    """
+    Arithmetic kernel converting validated DMS components to decimal degrees.
+    """
+    return round(degrees + minutes * _INV60 + seconds * _INV3600, 4)
+
+if njit is not None:
+    _dms_kernel = njit(cache=True, fastmath=True)(_dms_kernel)
+
+
 class DmsCoordinate:
     """
     Represents a geographical coordinate in Degrees, Minutes, Seconds (DMS) format.
     """
+    __slots__ = ('lat_degrees', 'lat_minutes', 'lat_seconds',
+                 'lon_degrees', 'lon_minutes', 'lon_seconds')
+
     def __init__(self, lat_degrees: int, lat_minutes: int, lat_seconds: int,
                  lon_degrees: int, lon_minutes: int, lon_seconds: int):
-        
+        """
+        Validates all coordinate components and stores them.
+
+        :raises TypeError: If any component is not an integer number
+        :raises ValueError: If any component is out of its acceptable range
+        """
+        # Check every component against its range in a single pass
+        for value, min_value, max_value, name in (
+            (lat_degrees, -90, 90, 'Degrees component of latitude'),
+            (lat_minutes, 0, 59, 'Minutes component of latitude'),
+            (lat_seconds, 0, 59, 'Seconds component of latitude'),
+            (lon_degrees, -180, 180, 'Degrees component of longitude'),
+            (lon_minutes, 0, 59, 'Minutes component of longitude'),
+            (lon_seconds, 0, 59, 'Seconds component of longitude'),
+        ):
+            if not isinstance(value, int):
+                raise TypeError(f"'{name}' must be an integer number")
+            if not min_value <= value <= max_value:
+                raise ValueError(f"'{name}' must be in range [{min_value};{max_value}]")
+
         self.lat_degrees = lat_degrees
         self.lat_minutes = lat_minutes
         self.lat_seconds = lat_seconds
@@ -15,98 +63,6 @@ class DmsCoordinate:
         self.lon_minutes = lon_minutes
         self.lon_seconds = lon_seconds
 
-    @staticmethod
-    def _check_value(value: int, min_value: int, max_value: int, name: str) -> None:
-        """
-        Validates a coordinate component to ensure it is within an acceptable range
-        and has the correct type.
-
-        :param value: The value to check (e.g., degrees, minutes, or seconds)
-        :param min_value: Minimum acceptable value
-        :param max_value: Maximum acceptable value
-        :param name: Name of the coordinate component (used for error messages)
-        :raises TypeError: If any parameter has the wrong type
-        :raises ValueError: If value is out of bounds or name is empty
-        """
-        if not isinstance(min_value, int) or not isinstance(max_value, int):
-            raise TypeError("Parameters 'min_value' and 'max_value' must be integer numbers")
-        if not isinstance(name, str):
-            raise TypeError("Parameter 'name' must be a string")
-        if not name.strip():
-            raise ValueError('Parameter name can not be empty')
-        
-        if not isinstance(value, int):
-            raise TypeError(f"'{name}' must be an integer number")
-
-        if not min_value <= value <= max_value:
-            raise ValueError(f"'{name}' must be in range [{min_value};{max_value}]")
-
-    @property
-    def lat_degrees(self) -> int:
-        """Returns the degrees component of latitude."""
-        return self.__lat_degrees
-    
-    @lat_degrees.setter
-    def lat_degrees(self, value) -> None:
-        """Sets value for the degrees component of latitude."""
-        self._check_value(value, -90, 90, 'Degrees component of latitude')
-        self.__lat_degrees = value
-
-    @property
-    def lat_minutes(self) -> int:
-        """Returns the minutes component of latitude."""
-        return self.__lat_minutes
-    
-    @lat_minutes.setter
-    def lat_minutes(self, value) -> None:
-        """Sets value for the minutes component of latitude."""
-        self._check_value(value, 0, 59, 'Minutes component of latitude')
-        self.__lat_minutes = value
-
-    @property
-    def lat_seconds(self) -> int:
-        """Returns the seconds component of latitude."""
-        return self.__lat_seconds
-    
-    @lat_seconds.setter
-    def lat_seconds(self, value) -> None:
-        """Sets value for the seconds component of latitude."""
-        self._check_value(value, 0, 59, 'Seconds component of latitude')
-        self.__lat_seconds = value
-
-    @property
-    def lon_degrees(self) -> int:
-        """Returns the degrees component of longitude."""
-        return self.__lon_degrees
-    
-    @lon_degrees.setter
-    def lon_degrees(self, value) -> None:
-        """Sets value for the degrees component of longitude."""
-        self._check_value(value, -180, 180, 'Degrees component of longitude')
-        self.__lon_degrees = value
-
-    @property
-    def lon_minutes(self) -> int:
-        """Returns the minutes component of longitude."""
-        return self.__lon_minutes
-    
-    @lon_minutes.setter
-    def lon_minutes(self, value) -> None:
-        """Sets value for the minutes component of longitude."""
-        self._check_value(value, 0, 59, 'Minutes component of longitude')
-        self.__lon_minutes = value
-
-    @property
-    def lon_seconds(self) -> int:
-        """Returns the seconds component of longitude."""
-        return self.__lon_seconds
-    
-    @lon_seconds.setter
-    def lon_seconds(self, value) -> None:
-        """Sets value for the seconds component of longitude."""
-        self._check_value(value, 0, 59, 'Seconds component of longitude')
-        self.__lon_seconds = value
-
 
 class Coordinate(ABC):
     """
@@ -131,6 +87,9 @@ class DmsCoordinateAdapter(Coordinate):
         LONGITUDE = 1
         LATITUDE = 2
 
+    # Maximum absolute degrees value for each type of coordinate
+    _MAX_VALUE = {CoordType.LONGITUDE: 180, CoordType.LATITUDE: 90}
+
     def __init__(self, dms: DmsCoordinate):
         # Check type
         if not isinstance(dms, DmsCoordinate):
@@ -165,18 +124,16 @@ class DmsCoordinateAdapter(Coordinate):
         :return: Coordinate in decimal degrees
         """
         # Check parameters' types
-        if not all(isinstance(item, int) for item in (degrees, minutes, seconds)):
+        if not (isinstance(degrees, int) and isinstance(minutes, int) and isinstance(seconds, int)):
             raise TypeError('degrees, minutes and seconds must be integer numbers')
         if not isinstance(coord_type, cls.CoordType):
             raise TypeError('coord_type must be an instance of CoordType')
             
         # Set max value for degrees
-        if coord_type == cls.CoordType.LONGITUDE:
-            max_value = 180
-        elif coord_type == cls.CoordType.LATITUDE:
-            max_value = 90
-        else:
-            raise ValueError('Unknown type of coordinate')
+        try:
+            max_value = cls._MAX_VALUE[coord_type]
+        except KeyError:
+            raise ValueError('Unknown type of coordinate') from None
         # Check values
         if abs(degrees) > max_value:
             raise ValueError(f'degrees must be in range [{-max_value};{max_value}]')
@@ -185,8 +142,44 @@ class DmsCoordinateAdapter(Coordinate):
         if abs(degrees) == max_value and (minutes or seconds):
             raise ValueError(f'Wrong coordinate value. It must be in range [{-max_value};{max_value}]')
         
-        return round(degrees + minutes / 60 + seconds / 3600, 4)
-    
+        return _dms_kernel(degrees, minutes, seconds)
+
+    @classmethod
+    def batch_to_decimal(cls, degrees: "np.ndarray", minutes: "np.ndarray", seconds: "np.ndarray",
+                         coord_type: CoordType) -> "np.ndarray":
+        """
+        Converts arrays of DMS components to decimal degrees in one vectorized pass.
+
+        :param degrees: Array of degree components
+        :param minutes: Array of minute components
+        :param seconds: Array of second components
+        :param coord_type: Type of coordinates (LATITUDE or LONGITUDE)
+        :return: Array of coordinates in decimal degrees
+        :raises TypeError: If any array does not contain integer numbers
+        :raises ValueError: If any component is out of its acceptable range
+        :raises ImportError: If numpy is not installed
+        """
+        if np is None:
+            raise ImportError('batch_to_decimal() requires numpy')
+        degrees, minutes, seconds = np.asarray(degrees), np.asarray(minutes), np.asarray(seconds)
+        # Check dtypes once instead of checking every element
+        if any(arr.dtype.kind not in 'iu' for arr in (degrees, minutes, seconds)):
+            raise TypeError('degrees, minutes and seconds must be arrays of integer numbers')
+        if not isinstance(coord_type, cls.CoordType):
+            raise TypeError('coord_type must be an instance of CoordType')
+
+        # Same range checks as _dms_to_degrees, over whole arrays
+        max_value = cls._MAX_VALUE[coord_type]
+        # Compare directly, np.abs wraps around on signed minimums such as int8 -128
+        if np.any((degrees < -max_value) | (degrees > max_value)):
+            raise ValueError(f'degrees must be in range [{-max_value};{max_value}]')
+        if np.any((minutes < 0) | (minutes >= 60) | (seconds < 0) | (seconds >= 60)):
+            raise ValueError('minutes and seconds must be in range [0;60)')
+        if np.any(((degrees == max_value) | (degrees == -max_value)) & ((minutes != 0) | (seconds != 0))):
+            raise ValueError(f'Wrong coordinate value. It must be in range [{-max_value};{max_value}]')
+
+        return np.round(degrees + minutes * _INV60 + seconds * _INV3600, 4)
+
 
 def display_coordinates(coord: Coordinate):
     """
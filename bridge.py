@@ -1,73 +1,66 @@
-from abc import ABC, abstractmethod
-from typing import List
-import matplotlib.pyplot as plt
+from dataclasses import dataclass
+from typing import List, Protocol
+import numpy as np
+from matplotlib.pyplot import bar, scatter, title, xlabel, ylabel, show
 
-class Style(ABC):
+class Style(Protocol):
     """Interface representing a chart style."""
-    @abstractmethod
-    def get_color(self) -> str:
-        """Return the main color used for chart elements."""
-
-    @abstractmethod
-    def get_linewidth(self) -> float:
-        """Return the line width for chart elements."""
-
-    @abstractmethod
-    def get_alpha(self) -> float:
-        """Return the alpha (transparency) value for chart elements."""
-
-    @abstractmethod
-    def get_fontsize(self) -> int:
-        """Return the font size used in chart text."""
-
-
-class SimpleStyle(Style):
+    # Main color used for chart elements
+    color: str
+    # Line width for chart elements
+    linewidth: float
+    # Alpha (transparency) value for chart elements
+    alpha: float
+    # Font size used in chart text
+    fontsize: int
+
+
+@dataclass(frozen=True, slots=True)
+class SimpleStyle:
     """Concrete Style implementation with simple styling."""
+    color: str = 'black'
+    linewidth: float = 0.5
+    alpha: float = 0.4
+    fontsize: int = 12
 
-    def get_color(self) -> str:
-        return 'black'
-
-    def get_linewidth(self) -> float:
-        return 0.5
-
-    def get_alpha(self) -> float:
-        return 0.4
-    
-    def get_fontsize(self) -> int:
-        return 12
-    
 
-class BrightStyle(Style):
+@dataclass(frozen=True, slots=True)
+class BrightStyle:
     """Concrete Style implementation with bright styling."""
+    color: str = 'blue'
+    linewidth: float = 5
+    alpha: float = 0.7
+    fontsize: int = 16
 
-    def get_color(self) -> str:
-        return 'blue'
 
-    def get_linewidth(self) -> float:
-        return 5
-
-    def get_alpha(self) -> float:
-        return 0.7
-    
-    def get_fontsize(self) -> int:
-        return 16
-
-
-class Chart(ABC):
-    """Abstract base class representing a chart."""
+class Chart:
+    """
+    Base class representing a chart.
+    Concrete charts define the plotting function, title and color keyword.
+    """
+    # Plotting function, chart title and keyword used to pass the color
+    _plot_fn = None
+    _title = ''
+    _color_key = 'color'
 
     def __init__(self, style: Style):
         """
         Initializes the chart with a style.
 
         :param style: Style instance to apply to the chart.
-        :raises TypeError: If style is not an instance of Style.
+        :raises TypeError: If style does not provide the Style interface.
         """
-        if not isinstance(style, Style):
-            raise TypeError("Parameter 'style' must be an instance of Style")
+        if not all(hasattr(style, attr) for attr in ('color', 'linewidth', 'alpha', 'fontsize')):
+            raise TypeError("Parameter 'style' must implement the Style interface")
         self._style = style
+        # Style values do not change during the chart's life, so read them once
+        self._style_kwargs = {
+            self._color_key: style.color,
+            'linewidth': style.linewidth,
+            'alpha': style.alpha,
+        }
+        self._fontsize = style.fontsize
 
-    @abstractmethod
     def build(self, labels: List[str], values: List[int | float]) -> None:
         """
         Builds and displays the chart.
@@ -75,6 +68,18 @@ class Chart(ABC):
         :param labels: List of labels on X-axis.
         :param values: List of values on Y-axis.
         """
+        self._check_data(labels, values)
+        try:
+            self._plot_fn(labels, values, **self._style_kwargs)
+            fontsize = self._fontsize
+            title(self._title, fontsize=fontsize + 2)
+            xlabel('Labels', fontsize=fontsize)
+            ylabel('Values', fontsize=fontsize)
+            show()
+        except (ValueError, TypeError, KeyError) as e:
+            print(f"Chart rendering failed: {e}")
+        except Exception as e:
+            print(e)
     
     @staticmethod
     def _check_data(labels: str, values: List[int | float]) -> None:
@@ -93,62 +98,37 @@ class Chart(ABC):
         if len(labels) != len(values):
             raise ValueError("'labels' and 'values' must have equal sizes")
         # Check elements' types
-        for el in labels:
-            if not isinstance(el, str):
-                raise TypeError("all labels must be strings")
-        for el in values:
-            if not isinstance(el, (int, float)):
+        if not all(type(el) is str for el in labels):
+            raise TypeError("all labels must be strings")
+        # Let numpy infer a single dtype for all values instead of checking each one
+        try:
+            array = np.asarray(values)
+        except (ValueError, TypeError):
+            # Ragged nested sequences cannot form an array
+            array = None
+        # Nested lists of numbers give a numeric dtype too, so check the shape;
+        # bools and ints beyond int64 are numbers as well, but need the
+        # per-element check
+        if array is None or array.ndim != 1 or array.dtype.kind not in 'iuf':
+            if not all(isinstance(el, (int, float)) for el in values):
                 raise TypeError("all values must be numbers")
 
 
 class BarChart(Chart):
     """
     Concrete chart class for bar charts.
-    """    
-    def build(self, labels: List[str], values: List[int | float]) -> None:
-        super()._check_data(labels, values)
-        try:
-            plt.bar(
-                labels,
-                values,
-                color=self._style.get_color(),
-                linewidth=self._style.get_linewidth(),
-                alpha=self._style.get_alpha(),
-            )
-            fontsize = self._style.get_fontsize()
-            plt.title('Bar Chart', fontsize=fontsize + 2)
-            plt.xlabel('Labels', fontsize=fontsize)
-            plt.ylabel('Values', fontsize=fontsize)
-            plt.show()
-        except (ValueError, TypeError, KeyError) as e:
-            print(f"Chart rendering failed: {e}")
-        except Exception as e:
-            print(e)
+    """
+    _plot_fn = staticmethod(bar)
+    _title = 'Bar Chart'
 
 
-class ScatterChart(Chart):  
+class ScatterChart(Chart):
     """
     Concrete chart class for scatter charts.
-    """  
-    def build(self, labels: List[str], values: List[int | float]) -> None:
-        super()._check_data(labels, values)
-        try:
-            plt.scatter(
-                labels,
-                values,
-                c=self._style.get_color(),
-                linewidth=self._style.get_linewidth(),
-                alpha=self._style.get_alpha(),
-            )
-            fontsize = self._style.get_fontsize()
-            plt.title('Scatter Chart', fontsize=fontsize + 2)
-            plt.xlabel('Labels', fontsize=fontsize)
-            plt.ylabel('Values', fontsize=fontsize)
-            plt.show()
-        except (ValueError, TypeError, KeyError) as e:
-            print(f"Chart rendering failed: {e}")
-        except Exception as e:
-            print(e)
+    """
+    _plot_fn = staticmethod(scatter)
+    _title = 'Scatter Chart'
+    _color_key = 'c'
 
 
 def main():
@@ -1,6 +1,15 @@
 from abc import ABC, abstractmethod
-from functools import wraps
-from typing import Optional, Any
+from enum import IntEnum
+import sys
+
+class _Part(IntEnum):
+    """Positions of report parts in the order they appear in the report."""
+    NAME = 0
+    CONTENT = 1
+    FOOTER = 2
+
+# Canonical part names, interned so that lookups with builder literals hit by identity
+_PART_NAMES = tuple(sys.intern(name) for name in ('name', 'content', 'footer'))
 
 class Report:
     """
@@ -10,10 +19,12 @@ class Report:
     ('name', 'content', 'footer') are allowed.
     """
     # Allowed part names
-    _part_names = ('name', 'content', 'footer')
+    _part_names = _PART_NAMES
+    # Positions of allowed parts in the parts list
+    _KEY_TO_IDX = dict(zip(_PART_NAMES, _Part))
     
     def __init__(self) -> None:
-        self._parts = {}
+        self._parts = ['', '', '']
 
     def add(self, key: str, value: str) -> None:
         """
@@ -28,33 +39,23 @@ class Report:
         if not isinstance(key, str) or not isinstance(value, str):
             raise TypeError('Key and Value must be strings')
         
-        # Check key value
-        key = key.strip().lower()
-        if key not in self._part_names:
-            raise ValueError(f'Wrong part name "{key}"')
+        # Check key value, normalizing it only if it is not already canonical
+        index = self._KEY_TO_IDX.get(key)
+        if index is None:
+            key = key.strip().lower()
+            index = self._KEY_TO_IDX.get(key)
+            if index is None:
+                raise ValueError(f'Wrong part name "{key}"')
         
-        self._parts[key] = value
+        self._parts[index] = value
 
     def __str__(self) -> str:
         """
         Return the full report as a string by combining all parts in order.
         Only non-empty parts are included.
         """
-        return '\n'.join(self._parts.get(key, '') for key in self._part_names if self._parts.get(key, ''))
-
+        return '\n'.join(part for part in self._parts if part)
 
-def validate_text(func):
-    """
-    Decorator that trims and validates non-empty text before passing it to the decorated method.
-    """
-    @wraps(func)
-    def wrapper(self, text: str) -> Optional[Any]:
-        # Delete whitespaces
-        text = text.strip()
-        # Call func if text is not empty
-        if text:
-            return func(self, text)
-    return wrapper
 
 class ReportBuilder(ABC):
     """Abstract builder interface for constructing report parts."""
@@ -97,17 +98,20 @@ class PlainTextReportBuilder(ReportBuilder):
     def __init__(self):
         self._report = Report()
 
-    @validate_text
     def add_title(self, text: str) -> None:
-        self._report.add('name', text)
+        text = text.strip()
+        if text:
+            self._report.add('name', text)
     
-    @validate_text
     def add_content(self, text: str) -> None:
-        self._report.add('content', text)
+        text = text.strip()
+        if text:
+            self._report.add('content', text)
 
-    @validate_text
     def add_footer(self, text: str) -> None:
-        self._report.add('footer', text)
+        text = text.strip()
+        if text:
+            self._report.add('footer', text)
 
     def get_result(self) -> Report:
         """
@@ -126,17 +130,20 @@ class MarkdownReportBuilder(ReportBuilder):
     def __init__(self):
         self._report = Report()
 
-    @validate_text
     def add_title(self, text: str) -> None:
-        self._report.add('name', '# '+text)
+        text = text.strip()
+        if text:
+            self._report.add('name', '# ' + text)
 
-    @validate_text
     def add_content(self, text: str) -> None:
-        self._report.add('content', text + '\n')
+        text = text.strip()
+        if text:
+            self._report.add('content', text + '\n')
 
-    @validate_text
     def add_footer(self, text: str) -> None:
-        self._report.add('footer', '---\n' + text)
+        text = text.strip()
+        if text:
+            self._report.add('footer', '---\n' + text)
 
     def get_result(self) -> Report:
         """
@@ -1,10 +1,22 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Optional
 import os
+import csv
 import json
-import pandas as pd
 import xml.etree.ElementTree as ET
 
+try:
+    import ijson
+except ImportError:
+    # ijson is optional, JSON files are then parsed whole with json.load
+    ijson = None
+
+# Errors raised for malformed JSON by the parsers in use
+_JSON_ERRORS = (
+    (json.JSONDecodeError,) if ijson is None
+    else (json.JSONDecodeError, ijson.JSONError)
+)
+
 
 class Handler(ABC):
     """
@@ -12,11 +24,12 @@ class Handler(ABC):
     """
 
     @abstractmethod
-    def handle(self, file_path: str) -> Optional[str]:
+    def handle(self, file_path: str, ext: str) -> Optional[str]:
         """
         Handle the given request or pass it to the next handler.
 
-        :param request: The request to handle.
+        :param file_path: Path to the file.
+        :param ext: Lowercase file extension including the leading dot.
         :return: Optional response string.
         """
 
@@ -40,7 +53,8 @@ class FileHandler(Handler):
             raise TypeError("Parameter 'handler' must be an instance of Handler")
         self._next_handler = handler
 
-    def _check_file_path(self, file_path: str):
+    @staticmethod
+    def _check_file_path(file_path: str):
         """
         Validate the file path.
 
@@ -58,15 +72,16 @@ class FileHandler(Handler):
                 f"File '{file_path}' was not found or it is not a file."
             )
 
-    def handle(self, file_path: str) -> Optional[str]:
+    def handle(self, file_path: str, ext: str) -> Optional[str]:
         """
         Pass the request to the next handler if available.
 
         :param file_path: Path to the file.
+        :param ext: Lowercase file extension including the leading dot.
         :return: Response from next handler or None.
         """
         if self._next_handler:
-            return self._next_handler.handle(file_path)
+            return self._next_handler.handle(file_path, ext)
         return None
 
 
@@ -75,37 +90,74 @@ class JSONHandler(FileHandler):
     Handler for JSON files.
     """
 
-    def handle(self, file_path: str) -> Optional[str]:
+    def handle(self, file_path: str, ext: str) -> Optional[str]:
         """
         Process JSON file if extension matches, else pass to next handler.
 
         :param file_path: Path to the JSON file.
+        :param ext: Lowercase file extension including the leading dot.
         :return: Info string or None.
         """
-        self._check_file_path(file_path)
-        if file_path.lower().endswith(".json"):
+        if ext == ".json":
             try:
-                with open(file_path, "r", encoding="utf-8") as file:
+                with open(file_path, "rb") as file:
+                    # Classify the document by its first character and stream it
+                    first_char = self._read_first_char(file)
+                    file.seek(0)
+                    if ijson is not None and first_char == b"{":
+                        # Repeated keys are listed once, like the keys of json.load()
+                        keys = dict.fromkeys(
+                            value for prefix, event, value in ijson.parse(file)
+                            if prefix == "" and event == "map_key"
+                        )
+                        if not keys:
+                            return f"File {file_path} is empty."
+                        return (
+                            f"File {file_path} is a dictionary with keys: " +
+                            ", ".join(keys) + "."
+                        )
+                    if ijson is not None and first_char == b"[":
+                        count = sum(1 for _ in ijson.items(file, "item"))
+                        if not count:
+                            return f"File {file_path} is empty."
+                        return f"File {file_path} is a list with {count} element(s)."
+                    # Scalar documents are small, so parse them fully;
+                    # without ijson containers are parsed fully as well
                     data = json.load(file)
                     if not data:
                         return f"File {file_path} is empty."
-                    elif isinstance(data, dict):
+                    if isinstance(data, dict):
                         return (
                             f"File {file_path} is a dictionary with keys: " +
                             ", ".join(data.keys()) + "."
                         )
-                    elif isinstance(data, list):
+                    if isinstance(data, list):
                         return f"File {file_path} is a list with {len(data)} element(s)."
-                    else:
-                        return f"File {file_path} contains an instance of {type(data).__name__}."
+                    return f"File {file_path} contains an instance of {type(data).__name__}."
             except PermissionError:
                 print(f"[Error] No permission to read the file {file_path}.")
-            except json.JSONDecodeError:
+            except _JSON_ERRORS:
                 print(f"[Error] JSON file {file_path} is not properly formatted.")
             except Exception as e:
                 print(f"An error occurred while reading {file_path}: {e}")
         else:
-            return super().handle(file_path)
+            return super().handle(file_path, ext)
+
+    @staticmethod
+    def _read_first_char(file) -> bytes:
+        """
+        Read the first non-whitespace byte of the file.
+
+        :param file: File opened in binary mode.
+        :return: The byte or an empty bytes object if there is none.
+        :raises json.JSONDecodeError: If the file starts with a UTF-8 BOM.
+        """
+        if file.read(3) == b"\xef\xbb\xbf":
+            raise json.JSONDecodeError("Unexpected UTF-8 BOM", "", 0)
+        file.seek(0)
+        while (char := file.read(1)) and char.isspace():
+            pass
+        return char
 
 
 class CSVHandler(FileHandler):
@@ -113,35 +165,48 @@ class CSVHandler(FileHandler):
     Handler for CSV files.
     """
 
-    def handle(self, file_path: str) -> Optional[str]:
+    def handle(self, file_path: str, ext: str) -> Optional[str]:
         """
         Process CSV file if extension matches, else pass to next handler.
 
         :param file_path: Path to the CSV file.
+        :param ext: Lowercase file extension including the leading dot.
         :return: Info string or None.
         """
-        self._check_file_path(file_path)
-        if file_path.lower().endswith(".csv"):
+        if ext == ".csv":
             try:
-                df = pd.read_csv(file_path, header=None)
-                if df.empty:
-                    return f"File {file_path} is empty."
-                col_count = len(df.columns)
-                row_count = len(df)            
+                with open(file_path, "r", newline="", encoding="utf-8") as file:
+                    # Stream rows, skipping blank and whitespace-only lines,
+                    # instead of loading the whole table
+                    rows = (
+                        row for row in csv.reader(file)
+                        if row and not (len(row) == 1 and
+                                        (not row[0] or row[0].isspace()))
+                    )
+                    first = next(rows, None)
+                    if first is None:
+                        return f"File {file_path} is empty."
+                    col_count = len(first)
+                    row_count = 1
+                    for row in rows:
+                        # The first row sets the width, longer rows are malformed
+                        if len(row) > col_count:
+                            raise csv.Error(
+                                f"Expected {col_count} fields, saw {len(row)}"
+                            )
+                        row_count += 1
                 return (
                     f"File {file_path} contains {row_count} row(s)" +
                     f" and {col_count} column(s)."
                 )
             except PermissionError:
                 print(f"[Error] No permission to read the file {file_path}")
-            except pd.errors.EmptyDataError:
-                print(f"[Error] File {file_path} is empty or invalid.")
-            except pd.errors.ParserError:
+            except csv.Error:
                 print(f"[Error] file {file_path} is not properly formatted.")
             except Exception as e:
                 print(f"An error occurred while reading {file_path}: {e}")
         else:
-            return super().handle(file_path)
+            return super().handle(file_path, ext)
 
 
 class XMLHandler(FileHandler):
@@ -149,21 +214,33 @@ class XMLHandler(FileHandler):
     Handler for XML files.
     """
 
-    def handle(self, file_path: str) -> Optional[str]:
+    def handle(self, file_path: str, ext: str) -> Optional[str]:
         """
         Process XML file if extension matches, else pass to next handler.
 
         :param file_path: Path to the XML file.
+        :param ext: Lowercase file extension including the leading dot.
         :return: Info string or None.
         """
-        self._check_file_path(file_path)
-        if file_path.lower().endswith(".xml"):
+        if ext == ".xml":
             try:
-                tree = ET.parse(file_path)
-                root = tree.getroot()
+                events = ET.iterparse(file_path, events=("start", "end"))
+                _, root = next(events)
+                count = 0
+                depth = 1
+                for event, _ in events:
+                    if event == "start":
+                        if depth == 1:
+                            count += 1
+                        depth += 1
+                    else:
+                        depth -= 1
+                        if depth == 1:
+                            # Drop finished direct children instead of keeping the whole tree
+                            root.clear()
                 return (
                     f"Root tag for {file_path}: '{root.tag}'. "
-                    f"Number of direct child elements: {len(root)}."
+                    f"Number of direct child elements: {count}."
                 )
             except PermissionError:
                 print(f"[Error] No permission to read the file {file_path}.")
@@ -172,20 +249,39 @@ class XMLHandler(FileHandler):
             except Exception as e:
                 print(f"An error occurred while reading {file_path}: {e}")
         else:
-            return super().handle(file_path)
+            return super().handle(file_path, ext)
+
+
+def handle_file(file_path: str, handlers: Dict[str, Handler]) -> Optional[str]:
+    """
+    Validate the file path once and pass it to the handler registered for its extension.
+
+    :param file_path: Path to the file.
+    :param handlers: Mapping of lowercase file extensions to handlers.
+    :return: Response from the matching handler or None.
+    :raises TypeError: If file_path is not a string.
+    :raises ValueError: If file_path is empty or whitespace.
+    :raises FileNotFoundError: If the file does not exist or is not a file.
+    """
+    FileHandler._check_file_path(file_path)
+    # Classify the file once for all handlers
+    ext = os.path.splitext(file_path)[1].lower()
+    handler = handlers.get(ext)
+    if handler is None:
+        return None
+    return handler.handle(file_path, ext)
 
 
 def main():
     """
     Entry point demonstrating the Chain of Responsibility pattern with file handlers.
     """
-    json_handler = JSONHandler()
-    csv_handler = CSVHandler()
-    xml_handler = XMLHandler()
-
-    # Setup chain JSON -> CSV -> XML
-    json_handler.set_next(csv_handler)
-    csv_handler.set_next(xml_handler)
+    # Map file extensions directly to their handlers
+    handlers = {
+        ".json": JSONHandler(),
+        ".csv": CSVHandler(),
+        ".xml": XMLHandler(),
+    }
 
     file_path = input("Enter the path to your file: ").strip()
     if not file_path.strip():
@@ -193,7 +289,7 @@ def main():
         return
 
     try:
-        result = json_handler.handle(file_path)
+        result = handle_file(file_path, handlers)
         if result:
             print(result)
         else:
@@ -1,30 +1,54 @@
-from abc import ABC, abstractmethod
+from functools import lru_cache
+import math
+import sys
 
 class InsufficientFundsError(Exception):
     """Raised when an account has insufficient balance for the operation."""
 
 
+def _validate_money(amount) -> int:
+    """
+    Validates that the given amount is a positive number.
+
+    :param amount: The amount to validate.
+    :return: The amount converted to integer cents.
+    :raises TypeError: If amount is not a number.
+    :raises ValueError: If amount is not positive or not finite.
+    """
+    # Checked before the cache, so unhashable values get the documented error
+    if not isinstance(amount, (int, float)):
+        raise TypeError(
+            "Parameter 'amount' must be an instance of float"
+        )
+    return _money_to_cents(amount)
+
+
+@lru_cache(maxsize=256)
+def _money_to_cents(amount: int | float) -> int:
+    """
+    Checks the range of a number and converts it to cents.
+    Results are cached since commands validate the same amounts repeatedly.
+
+    :param amount: The amount to convert.
+    :return: The amount converted to integer cents.
+    :raises ValueError: If amount is not positive or not finite.
+    """
+    if amount <= 0:
+        raise ValueError("Parameter 'amount' must be positive number")
+    # Comparing with inf also rejects NaN, for which every test is False
+    if not amount < math.inf:
+        raise ValueError("Parameter 'amount' must be a finite number")
+    return int(round(amount * 100))
+
+
 class MoneyValidator:
     """
     Provides static validation for monetary values.
     Ensures the amount is a positive number (int or float).
     """
+    __slots__ = ()
 
-    @staticmethod
-    def validate_money(amount) -> float:
-        """
-        Validates that the given amount is a positive number.
-
-        :param amount: The amount to validate.
-        :raises TypeError: If amount is not a number.
-        :raises ValueError: If amount is not positive.
-        """
-        if not isinstance(amount, (int, float)):
-            raise TypeError(
-                "Parameter 'amount' must be an instance of float"
-            )
-        if amount <= 0:
-            raise ValueError("Parameter 'amount' must be positive number")
+    validate_money = staticmethod(_validate_money)
 
 
 class BankAccount(MoneyValidator):
@@ -33,13 +57,12 @@ class BankAccount(MoneyValidator):
     Inherits from MoneyValidator to validate monetary input.
     """
 
-    _precision: int = 2  # Number of decimal places to round to
-
     def __init__(self):
         """
         Initializes the account with a zero starting balance.
+        The balance is stored in integer cents to avoid float rounding.
         """
-        self.__balance = 0
+        self.__balance_cents = 0
 
     def increase_balance(self, amount: float):
         """
@@ -47,10 +70,7 @@ class BankAccount(MoneyValidator):
 
         :param amount: Amount to deposit.
         """
-        self.validate_money(amount)
-        amount = round(amount, self._precision)
-        self.__balance += amount
-        self.__balance = round(self.__balance, self._precision)
+        self._apply_cents(self.validate_money(amount))
     
     def decrease_balance(self, amount: float):
         """
@@ -59,25 +79,33 @@ class BankAccount(MoneyValidator):
         :param amount: Amount to withdraw.
         :raises InsufficientFundsError: If withdrawal amount exceeds balance.
         """
-        self.validate_money(amount)
-        amount = round(amount, self._precision)
-        if self.__balance < amount:
+        self._apply_cents(-self.validate_money(amount))
+
+    def _apply_cents(self, cents: int):
+        """
+        Applies an already validated signed change in cents to the balance.
+
+        :param cents: Change of the balance in cents.
+        :raises InsufficientFundsError: If the change makes the balance negative.
+        """
+        balance = self.__balance_cents + cents
+        if balance < 0:
             raise InsufficientFundsError("Insufficient funds for withdrawal")
-        self.__balance -= amount
-        self.__balance = round(self.__balance, self._precision)
+        self.__balance_cents = balance
     
     def show_balance(self):
         """
         Prints the current balance.
         """
-        print(f"Current balance: {self.__balance:.2f}")
+        print(f"Current balance: {self.__balance_cents / 100:.2f}")
 
 
-class Command(ABC):
+class Command:
     """
-    Abstract base class for all commands.
+    Base class for all commands.
     Holds a reference to the BankAccount object.
     """
+    __slots__ = ('_account',)
 
     def __init__(self, account: BankAccount):
         """
@@ -86,21 +114,23 @@ class Command(ABC):
         :param account: The target BankAccount.
         :raises TypeError: If account is not a BankAccount instance.
         """
-        if not isinstance(account, BankAccount):
-            raise TypeError(
-                "Parameter 'account' must be an instance of BankAccount"
-            )
+        if __debug__:
+            if not isinstance(account, BankAccount):
+                raise TypeError(
+                    "Parameter 'account' must be an instance of BankAccount"
+                )
         self._account = account
 
-    @abstractmethod
     def execute(self):
         """Executes the command."""
+        raise NotImplementedError
 
 
 class IncreaseBalanceCommand(Command, MoneyValidator):
     """
     Command to deposit money into a bank account.
     """
+    __slots__ = ('_cents',)
 
     def __init__(self, account: BankAccount, amount: float):
         """
@@ -110,20 +140,21 @@ class IncreaseBalanceCommand(Command, MoneyValidator):
         :param amount: Amount to deposit.
         """
         super().__init__(account)
-        self.validate_money(amount)
-        self._amount = amount
+        # Validate once here so execution can skip it
+        self._cents = self.validate_money(amount)
 
     def execute(self):
         """
         Executes the deposit operation.
         """
-        self._account.increase_balance(self._amount)
+        self._account._apply_cents(self._cents)
 
 
 class DecreaseBalanceCommand(Command, MoneyValidator):
     """
     Command to withdraw money from a bank account.
     """
+    __slots__ = ('_cents',)
 
     def __init__(self, account: BankAccount, amount: float):
         """
@@ -133,20 +164,21 @@ class DecreaseBalanceCommand(Command, MoneyValidator):
         :param amount: Amount to withdraw.
         """
         super().__init__(account)
-        self.validate_money(amount)
-        self._amount = amount
+        # Validate once here so execution can skip it
+        self._cents = -self.validate_money(amount)
 
     def execute(self):
         """
         Executes the withdrawal operation.
         """
-        self._account.decrease_balance(self._amount)
+        self._account._apply_cents(self._cents)
 
 
 class ShowBalanceCommand(Command):
     """
     Command to display the current account balance.
     """
+    __slots__ = ()
 
     def execute(self):
         """
@@ -159,6 +191,7 @@ class Button:
     """
     Represents an invoker that triggers a command via a button press.
     """
+    __slots__ = ('__name', '__command')
 
     def __init__(self, name: str, command: Command):
         """
@@ -168,12 +201,13 @@ class Button:
         :param command: Command to be executed.
         :raises TypeError, ValueError: On invalid parameters.
         """
-        if not isinstance(name, str):
-            raise TypeError("Parameter 'name' must be a string.")
+        if __debug__:
+            if not isinstance(name, str):
+                raise TypeError("Parameter 'name' must be a string.")
+            if not isinstance(command, Command):
+                raise TypeError("Parameter 'command' must be an instance of Command")
         if not name.strip():
             raise ValueError("Parameter 'name' could not be empty")
-        if not isinstance(command, Command):
-            raise TypeError("Parameter 'command' must be an instance of Command")
         self.__name = name
         self.__command = command
 
@@ -199,6 +233,9 @@ def main():
     - press 'w' to withdraw money
     - press 's' to show the balance
     - press 'q' to quit
+
+    When input is not a terminal, all commands are read from stdin at once
+    and the menu and pause prompts are skipped.
     """
     account = BankAccount()
     deposit_cmd = IncreaseBalanceCommand(account, 50)
@@ -207,33 +244,48 @@ def main():
     withdraw_btn = Button("Withdraw $30", withdraw_cmd)
     show_cmd = ShowBalanceCommand(account)
     show_btn = Button("Show Balance", show_cmd)
+
+    def deposit():
+        deposit_btn.do_operation()
+        print("Transaction successful: $50 deposited.")
+
+    def withdraw():
+        try:
+            withdraw_btn.do_operation()
+            print("Transaction successful: $30 withdrawn.")
+        except InsufficientFundsError as e:
+            print(f"Error: {e}")
+
+    # Map menu keys to their actions
+    actions = {'d': deposit, 'w': withdraw, 's': show_btn.do_operation}
+
+    interactive = sys.stdin.isatty()
+    if not interactive:
+        # Read scripted input in one go instead of line by line
+        scripted_commands = iter(sys.stdin.read().splitlines())
                    
     while True:
-        print("\n--- MENU ---")
-        print(f"d - {deposit_btn}")
-        print(f"w - {withdraw_btn}")
-        print(f"s - {show_btn}")
-        print("q - Quit")
-
-        command = input("Choose an action: ").strip().lower()
-        match(command):
-            case 'd':
-                deposit_btn.do_operation()
-                print("Transaction successful: $50 deposited.")
-            case 'w':
-                try:
-                    withdraw_btn.do_operation()
-                    print("Transaction successful: $30 withdrawn.")
-                except InsufficientFundsError as e:
-                    print(f"Error: {e}")
-            case 's':
-                show_btn.do_operation()
-            case 'q':
-                print("Exiting.")
-                break
-            case _:
-                print("Invalid input. Please choose 'd', 'w', 's', or 'q'.")
-        input("Press Enter to continue. ")
+        if interactive:
+            print("\n--- MENU ---")
+            print(f"d - {deposit_btn}")
+            print(f"w - {withdraw_btn}")
+            print(f"s - {show_btn}")
+            print("q - Quit")
+            command = input("Choose an action: ")
+        else:
+            # End of scripted input works as quit
+            command = next(scripted_commands, 'q')
+        command = command.strip().lower()
+        if command == 'q':
+            print("Exiting.")
+            break
+        action = actions.get(command)
+        if action is None:
+            print("Invalid input. Please choose 'd', 'w', 's', or 'q'.")
+        else:
+            action()
+        if interactive:
+            input("Press Enter to continue. ")
 
 
 if __name__ == "__main__":
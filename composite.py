@@ -1,30 +1,26 @@
-from abc import ABC, abstractmethod
+from typing import List, Optional
 
-class MenuComponent(ABC):
+class MenuComponent:
     """
-    Abstract base class representing a menu component.
+    Base class representing a menu component.
     """
 
-    @abstractmethod
     def calculate_price(self) -> int:
         """Calculates and returns the price of the MenuComponent """
+        raise NotImplementedError
 
-    @abstractmethod
     def display(self, indent: int) -> None:
         """
         Displays information about MenuComponent with given indentation.
         :param indent: Indentation level (number of spaces).
         """
+        raise NotImplementedError
 
-    @property
-    def name(self):
-        return self.__name
-    
-    @name.setter
-    def name(self, value):
+    @staticmethod
+    def _validate_name(value):
         """
-        Sets and validates the name of the component.
-        :param value: New name as a non-empty string.
+        Validates the name of the component.
+        :param value: Name as a non-empty string.
         :raises TypeError: If value is not a string.
         :raises ValueError: If value is empty.
         """
@@ -32,7 +28,6 @@ class MenuComponent(ABC):
             raise TypeError("Name must be a string")
         if not value.strip():
             raise ValueError("Name can not be empty")
-        self.__name = value
 
 
 class Dish(MenuComponent):
@@ -47,6 +42,7 @@ class Dish(MenuComponent):
         :raises TypeError: If price is not an integer.
         :raises ValueError: If price is not positive.
         """
+        self._validate_name(name)
         self.name = name
         if not isinstance(price, int):
             raise TypeError('Price must be integer number')
@@ -81,8 +77,13 @@ class Order(MenuComponent):
         Initializes an order with a name and empty component list.
         :param name: Name of the order.
         """
+        self._validate_name(name)
         self.name = name
         self.__components = []
+        # Orders containing this one, notified when its price changes
+        self.__parents: List['Order'] = []
+        # Total price computed on the last call, None if it must be recomputed
+        self.__cached_price: Optional[int] = None
 
     def add(self, item: MenuComponent):
         """
@@ -90,9 +91,14 @@ class Order(MenuComponent):
         :param item: MenuComponent.
         :raises TypeError: If item is not a MenuComponent.
         """
-        if not isinstance(item, MenuComponent):
-            raise TypeError("Item must be an instance of MenuComponent")
+        # Type checks are skipped when running with python -O
+        if __debug__:
+            if not isinstance(item, MenuComponent):
+                raise TypeError("Item must be an instance of MenuComponent")
         self.__components.append(item)
+        if isinstance(item, Order):
+            item.__parents.append(self)
+        self._invalidate_price()
     
     def remove(self, item: MenuComponent):
         """
@@ -100,17 +106,40 @@ class Order(MenuComponent):
         :param item: MenuComponent to remove.
         :raises TypeError: If item is not a MenuComponent.
         """
-        if not isinstance(item, MenuComponent):
-            raise TypeError("Item must be an instance of MenuComponent")
+        # Type checks are skipped when running with python -O
+        if __debug__:
+            if not isinstance(item, MenuComponent):
+                raise TypeError("Item must be an instance of MenuComponent")
         if item in self.__components:
             self.__components.remove(item)
+            if isinstance(item, Order):
+                item.__parents.remove(self)
+            self._invalidate_price()
+
+    def _invalidate_price(self):
+        """
+        Drops the cached prices of this order and of all orders containing it.
+        """
+        pending = [self]
+        while pending:
+            order = pending.pop()
+            # Ancestors of an order without a cached price have none either
+            if order.__cached_price is not None:
+                order.__cached_price = None
+                pending.extend(order.__parents)
 
     def calculate_price(self) -> int:
         """
         Calculates the total price of all components in this order.
         :return: Total price.
         """
-        return sum(component.calculate_price() for component in self.__components)
+        if self.__cached_price is None:
+            # Sub-orders return their own cached totals
+            total = 0
+            for component in self.__components:
+                total += component.calculate_price()
+            self.__cached_price = total
+        return self.__cached_price
 
     def display(self, indent: int = 0) -> None:
         """
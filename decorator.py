@@ -1,10 +1,14 @@
-from abc import ABC, abstractmethod
+import re
+import string
 
-class Validator(ABC):
+# ASCII characters checked in C before falling back to a Unicode scan
+_LETTERS = frozenset(string.ascii_letters)
+_DIGITS = frozenset(string.digits)
+
+class Validator:
     """
-    Abstract base class for validators.
+    Base class for validators.
     """
-    @abstractmethod
     def is_valid(self, data: str) -> bool:
         """
         Check if the input data is valid.
@@ -12,6 +16,7 @@ class Validator(ABC):
         :param data: The string to validate.
         :return: True if valid, False otherwise.
         """
+        raise NotImplementedError
 
 
 class PasswordValidator(Validator):
@@ -42,10 +47,12 @@ class ValidatorDecorator(Validator):
         :param validator: An instance of a Validator.
         :raises TypeError: If validator is not a Validator instance.
         """
-        if not isinstance(validator, Validator):
-            raise TypeError(
-                "Parameter 'validator' must be an instance of Validator"
-            )
+        # Type checks are skipped when running with python -O
+        if __debug__:
+            if not isinstance(validator, Validator):
+                raise TypeError(
+                    "Parameter 'validator' must be an instance of Validator"
+                )
         self._validator = validator
     
     def is_valid(self, data: str) -> bool:
@@ -92,6 +99,22 @@ class ValidateLengthDecorator(ValidatorDecorator):
         if length < 1:
             raise ValueError("Length must be positive number")
         self.__min_length = length
+        self._specialize()
+
+    def _specialize(self):
+        """
+        Build a length check with the wrapped validator and the minimum
+        length captured as constants, skipping attribute and property lookups.
+        """
+        validator = self._validator
+        min_length = self.__min_length
+
+        def check(data: str) -> bool:
+            if not isinstance(data, str):
+                raise TypeError("Data must be a string")
+            return validator.is_valid(data) and len(data) >= min_length
+
+        self.__check = check
 
     def is_valid(self, data: str) -> bool:
         """
@@ -101,7 +124,7 @@ class ValidateLengthDecorator(ValidatorDecorator):
         :param data: The password string to validate.
         :return: True if the string is valid, False otherwise.
         """
-        return super().is_valid(data) and len(data) >= self.min_length 
+        return self.__check(data)
     
 class ValidateLettersDecorator(ValidatorDecorator):
     """
@@ -115,7 +138,10 @@ class ValidateLettersDecorator(ValidatorDecorator):
         :param data: The password string to validate.
         :return: True if the string is valid, False otherwise.
         """
-        return super().is_valid(data) and any(c.isalpha() for c in data)
+        return super().is_valid(data) and (
+            not _LETTERS.isdisjoint(data)
+            or (not data.isascii() and any(c.isalpha() for c in data))
+        )
 
 
 class ValidateDigitsDecorator(ValidatorDecorator):
@@ -130,7 +156,55 @@ class ValidateDigitsDecorator(ValidatorDecorator):
         :param data: The password string to validate.
         :return: True if the string is valid, False otherwise.
         """
-        return super().is_valid(data) and any(c.isdecimal() for c in data)
+        return super().is_valid(data) and (
+            not _DIGITS.isdisjoint(data)
+            or (not data.isascii() and any(c.isdecimal() for c in data))
+        )
+
+
+class CompiledPasswordValidator(Validator):
+    """
+    Fast validator combining the checks of the decorators above
+    into a single precompiled regular expression.
+    """
+    def __init__(self, min_length: int = 8, letters: bool = True, digits: bool = True):
+        """
+        Build the regular expression for the requested checks.
+
+        :param min_length: Minimum number of characters.
+        :param letters: Require at least one letter.
+        :param digits: Require at least one digit.
+        :raises TypeError: If min_length is not an integer.
+        :raises ValueError: If min_length is less than 1.
+        """
+        if not isinstance(min_length, int):
+            raise TypeError("Length must be an integer number")
+        if min_length < 1:
+            raise ValueError("Length must be positive number")
+        # Every check is a lookahead, so the string is scanned by the regex engine only
+        rest = r'(?=.*\d)' if digits else ''
+        rest += rf'.{{{min_length},}}'
+        # Word characters except digits and underscore; for non-ASCII strings this
+        # also matches characters like '²' that str.isalpha rejects
+        letter = r'(?=.*[^\W\d_])' if letters else ''
+        self._re = re.compile(r'(?=.*\S)' + letter + rest, re.DOTALL)
+        # Pattern without the letter check for non-ASCII strings
+        self._re_no_letters = re.compile(r'(?=.*\S)' + rest, re.DOTALL) if letters else None
+
+    def is_valid(self, data: str) -> bool:
+        """
+        Check the string against all configured requirements at once.
+
+        :param data: The password string to validate.
+        :return: True if the string is valid, False otherwise.
+        :raises TypeError: If data is not a string.
+        """
+        if not isinstance(data, str):
+            raise TypeError("Data must be a string")
+        if self._re_no_letters is None or data.isascii():
+            return self._re.fullmatch(data) is not None
+        return (self._re_no_letters.fullmatch(data) is not None
+                and any(c.isalpha() for c in data))
 
 
 def validate_password(password: str, validator: Validator):
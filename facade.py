@@ -97,7 +97,12 @@ class ImageEditor:
         img = cls._open(source)
         if not img:
             return
-        cls._save(img.resize((width, height)), destination)  
+        if img.format == "JPEG":
+            # Let the decoder downscale while decoding, keeping enough detail for resampling
+            img.draft(img.mode, (width * 2, height * 2))
+        # Decode once, after the decoder has been configured
+        img.load()
+        cls._save(img.resize((width, height), Image.Resampling.LANCZOS), destination)
         
     @classmethod
     def rotate_image(
@@ -114,6 +119,7 @@ class ImageEditor:
         img = cls._open(source)
         if not img:
             return
+        img.load()
         cls._save(img.rotate(angle), destination)
 
     @classmethod
@@ -127,7 +133,11 @@ class ImageEditor:
         img = cls._open(source)
         if not img:
             return
-        cls._save(img.convert("L"), destination)  
+        if img.format == "JPEG":
+            # Decode only the luminance plane instead of all three channels
+            img.draft("L", img.size)
+        img.load()
+        cls._save(img.convert("L"), destination)
 
 
 def main():
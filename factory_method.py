@@ -1,15 +1,18 @@
-from abc import ABC, abstractmethod
+from collections import Counter
 import string
 
-class Logger(ABC):
-    """Abstract base class defining the logger interface."""
-    @abstractmethod
+# Translation table deleting all whitespace characters
+_STRIP_WS = str.maketrans('', '', string.whitespace)
+
+class Logger:
+    """Base class defining the logger interface."""
     def log(self, data: str) -> None:
         """
         Logs the provided string data.
 
         :param data: The message to be logged.
         """
+        raise NotImplementedError
 
 class ConsoleLogger(Logger):
     def log(self, data: str) -> None:
@@ -17,22 +20,31 @@ class ConsoleLogger(Logger):
         print(data, end='')
 
 class FileLogger(Logger):
+    def __init__(self, path: str = 'report.txt'):
+        """
+        Remember the log file; it is opened anew for every report.
+
+        :param path: Path to the log file.
+        """
+        self._path = path
+
     def log(self, data: str) -> None:
-        """Log message to a file named 'report.txt'. Overwrites file each time."""
-        with open('report.txt', 'w') as fhand:
+        """Log message to the log file. Overwrites file each time."""
+        # A single buffered write per report, the file is closed right after
+        with open(self._path, 'w', buffering=65536) as fhand:
             fhand.write(data)
 
-class TextAnalyzer(ABC):
+class TextAnalyzer:
     """
-    Abstract base class for text analyzers that process input text by counting
+    Base class for text analyzers that process input text by counting
     character frequencies (excluding whitespace) and logging the analysis results.
 
     Subclasses must implement create_logger() to provide a specific Logger
     for outputting the analysis report.
     """
-    @abstractmethod
     def create_logger(self) -> Logger:
         """Return logger object"""
+        raise NotImplementedError
 
     def analyze_text(self, text: str) -> None:
         """
@@ -54,40 +66,47 @@ class TextAnalyzer(ABC):
         # Convert text to lowercase
         text = text.lower()
         # Delete all whitespaces
-        text = text.translate(str.maketrans('', '', string.whitespace))
-        # Calculate char frequency
-        symbols = dict()
-        for c in text:
-            symbols[c] = symbols.get(c, 0) + 1
-        # Sort symbols by frequency
-        char_frequency = list(symbols.items())
-        char_frequency.sort(key=lambda item: item[1], reverse=True)
+        text = text.translate(_STRIP_WS)
+        # Calculate char frequency sorted by frequency
+        char_frequency = Counter(text).most_common()
         
         # Log report
         print('Text was analyzed successfully')
         logger = self.create_logger()
-        report = "Report\n"
-        report += f"Text consists of {len(text)} non-space character(s)\n"
-        report += "Char Frequency\n"
+        parts = [
+            "Report\n",
+            f"Text consists of {len(text)} non-space character(s)\n",
+            "Char Frequency\n",
+        ]
         for char, frequency in char_frequency:
-            report += f"'{char}': {frequency}\n"
-        logger.log(report)
+            parts.append(f"'{char}': {frequency}\n")
+        logger.log(''.join(parts))
 
 class TerminalTextAnalyzer(TextAnalyzer):
     """
     Text analyzer that logs analysis reports to the terminal (standard output)
     using a ConsoleLogger.
     """
+    # Console logger is stateless, so a single instance is shared
+    _logger = None
+
     def create_logger(self):
-        return ConsoleLogger()
+        if TerminalTextAnalyzer._logger is None:
+            TerminalTextAnalyzer._logger = ConsoleLogger()
+        return TerminalTextAnalyzer._logger
     
 class PersistentTextAnalyzer (TextAnalyzer):
     """
     Text analyzer that logs analysis reports to a file ('report.txt')
     using a FileLogger. Each report overwrites the previous content.
     """
+    # File logger keeps no open file, so a single instance is shared
+    _logger = None
+
     def create_logger(self):
-        return FileLogger()
+        if PersistentTextAnalyzer._logger is None:
+            PersistentTextAnalyzer._logger = FileLogger()
+        return PersistentTextAnalyzer._logger
 
 def main():
     """
@@ -1,8 +1,33 @@
+from functools import lru_cache
+from tkinter import TclError
 from turtle import Turtle, Screen
-from typing import Dict, Tuple
-import random
+from typing import Dict, List, Tuple
+import re
+import numpy as np
 from matplotlib.colors import CSS4_COLORS
 
+# Tk hex notations (#rgb, #rrggbb, ...), accepted without asking Tk
+_HEX_COLOR = re.compile(r"#(?:[0-9a-fA-F]{3}){1,4}")
+
+
+@lru_cache(maxsize=None)
+def _is_color_supported(color: str) -> bool:
+    """
+    Checks whether the given color is a hex color or a color name known to Tk,
+    which draws the figures for turtle.
+
+    :param color: Color string to validate.
+    :return: True if color is supported, False otherwise.
+    """
+    if _HEX_COLOR.fullmatch(color) is not None:
+        return True
+    try:
+        # Tk resolves every name turtle accepts; results are cached per color
+        Screen().getcanvas().winfo_rgb(color)
+    except TclError:
+        return False
+    return True
+
 
 class Figure:
     """
@@ -11,11 +36,9 @@ class Figure:
     This class encapsulates the drawing logic for a figure using the turtle graphics library.
     """
 
+    __slots__ = ('_shape', '_color')
+
     _shapes = {"circle", "square", "triangle"}
-    # Hidden turtle used only for validating color names
-    _test_turtle = Turtle()
-    _test_turtle.hideturtle()
-    _test_turtle.penup()
 
     def __init__(self, shape: str, color: str):
         """
@@ -26,16 +49,17 @@ class Figure:
         :raises TypeError: If shape or color is not a string.
         :raises ValueError: If shape is not supported or color is invalid.
         """
-        if not isinstance(shape, str):
-            raise TypeError("Parameter 'shape' must be a string.")
+        if __debug__:
+            if not isinstance(shape, str):
+                raise TypeError("Parameter 'shape' must be a string.")
+            if not isinstance(color, str):
+                raise TypeError("Parameter 'color' must be a string.")
         if shape not in self._shapes:
             raise ValueError(f"Bad shape name: '{shape}'.")
-        if not isinstance(color, str):
-            raise TypeError("Parameter 'color' must be a string.")
         if not self._is_color_supported(color):
             raise ValueError(f"Bad color name: '{color}'.")
-        self.__shape = shape
-        self.__color = color
+        self._shape = shape
+        self._color = color
 
     @classmethod
     def _is_color_supported(cls, color: str) -> bool:
@@ -45,11 +69,7 @@ class Figure:
         :param color: Color string to validate.
         :return: True if color is supported, False otherwise.
         """
-        try:
-            cls._test_turtle.color(color)
-            return True
-        except:
-            return False
+        return _is_color_supported(color)
 
     def draw(self, pen: Turtle, x: float, y: float):
         """
@@ -60,15 +80,19 @@ class Figure:
         :param y: Y-coordinate of the drawing position.
         :raises TypeError: If pen is not a Turtle or coordinates are not numbers.
         """
-        if not isinstance(pen, Turtle):
-            raise TypeError("Parameter 'turtle' must be an instance of turtle.Turtle.")
-        if not isinstance(x, (float, int)) or not isinstance(y, (float, int)):
-            raise TypeError("Parameters 'x' and 'y' must be float numbers.")
-
-        pen.shape(self.__shape)
+        if __debug__:
+            if not isinstance(pen, Turtle):
+                raise TypeError("Parameter 'turtle' must be an instance of turtle.Turtle.")
+            if not isinstance(x, (float, int)) or not isinstance(y, (float, int)):
+                raise TypeError("Parameters 'x' and 'y' must be float numbers.")
+
+        # Getters only read turtle state, setters reconfigure the canvas item,
+        # so skip the setters when the pen is already configured
+        if pen.shape() != self._shape:
+            pen.shape(self._shape)
+        if pen.fillcolor() != self._color or pen.pencolor() != '':
+            pen.color('', self._color)  # Set fill color only
         pen.goto((x, y))
-        pen.shapesize()  # Use default size
-        pen.color('', self.__color)  # Set fill color only
         pen.stamp()  # Stamp the current shape at the turtle's location
 
 
@@ -90,18 +114,23 @@ class FigureFactory:
         :raises TypeError: If parameters are not strings.
         :raises ValueError: If parameters are empty.
         """
-        if not isinstance(shape, str):
-            raise TypeError("Parameter 'shape' must be a string.")
-        if not shape.strip():
-            raise ValueError("Parameter 'shape' can not be empty.")
-        if not isinstance(color, str):
-            raise TypeError("Parameter 'color' must be a string.")
-        if not color.strip():
-            raise ValueError("Parameter 'color' can not be empty.")
-
-        if (shape, color) not in cls._figures:
-            cls._figures[(shape, color)] = Figure(shape, color)
-        return cls._figures[(shape, color)]
+        if __debug__:
+            if not isinstance(shape, str):
+                raise TypeError("Parameter 'shape' must be a string.")
+            if not shape.strip():
+                raise ValueError("Parameter 'shape' can not be empty.")
+            if not isinstance(color, str):
+                raise TypeError("Parameter 'color' must be a string.")
+            if not color.strip():
+                raise ValueError("Parameter 'color' can not be empty.")
+
+        key = (shape, color)
+        figures = cls._figures
+        figure = figures.get(key)
+        if figure is None:
+            # Figure.__init__ still validates shape and color
+            figure = figures[key] = Figure(shape, color)
+        return figure
 
     @classmethod
     def get_figure_count(cls) -> int:
@@ -124,19 +153,35 @@ def main():
     shapes = ("circle", "square", "triangle")
 
     screen = Screen()
+    # Disable automatic redraws; the canvas is refreshed in batches below
+    screen.tracer(0, 0)
     pen = Turtle()
     pen.penup()  # Prevent drawing lines when moving
     pen.hideturtle() # Hide turtle
 
-    for _ in range(count):
-        color = random.choice(colors)
-        shape = random.choice(shapes)
+    # Group random positions by figure so that pen setters change only
+    # when switching to the next figure
+    # Draw all random values at once instead of four calls per figure
+    rng = np.random.default_rng()
+    shape_idx = rng.integers(0, len(shapes), count).tolist()
+    color_idx = rng.integers(0, len(colors), count).tolist()
+    xs = rng.integers(-count, count + 1, count).tolist()
+    ys = rng.integers(-count, count + 1, count).tolist()
+    buckets: Dict[Tuple[str, str], List[Tuple[int, int]]] = {}
+    for s, c, x, y in zip(shape_idx, color_idx, xs, ys):
+        buckets.setdefault((shapes[s], colors[c]), []).append((x, y))
+
+    batch_size = 50
+    drawn = 0
+    for (shape, color), positions in buckets.items():
         figure = FigureFactory.get_figure(shape, color)
-        figure.draw(
-            pen,
-            random.randint(-count, count),
-            random.randint(-count, count)
-        )
+        for x, y in positions:
+            figure.draw(pen, x, y)
+            drawn += 1
+            # Show progress once per batch instead of once per stamp
+            if drawn % batch_size == 0:
+                screen.update()
+    screen.update()
 
     print(f"{count} random figures were painted.")
     print(f"{FigureFactory.get_figure_count()} unique Figure instance(s) were used.")
@@ -1,5 +1,6 @@
 from enum import Enum
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 
 class Status(Enum):
@@ -29,27 +30,35 @@ class TaskCollection(ABC):
         """
 
     @abstractmethod
-    def get_simple_iterator(self) -> "BasicIterator":
+    def _items(self) -> list:
+        """
+        Return the underlying list of tasks for trusted internal callers.
+
+        :return: The list backing the collection.
+        """
+
+    @abstractmethod
+    def get_simple_iterator(self) -> Iterator["Task"]:
         """
         Return an iterator over all tasks.
 
-        :return: A BasicIterator instance.
+        :return: An iterator over all tasks.
         """
 
     @abstractmethod
-    def get_active_tasks_iterator(self) -> "BasicIterator":
+    def get_active_tasks_iterator(self) -> Iterator["Task"]:
         """
         Return an iterator over active tasks only.
 
-        :return: A BasicIterator instance filtering ACTIVE tasks.
+        :return: An iterator filtering ACTIVE tasks.
         """
 
     @abstractmethod
-    def get_done_tasks_iterator(self) -> "BasicIterator":
+    def get_done_tasks_iterator(self) -> Iterator["Task"]:
         """
         Return an iterator over completed tasks only.
 
-        :return: A BasicIterator instance filtering DONE tasks.
+        :return: An iterator filtering DONE tasks.
         """
 
 
@@ -58,6 +67,8 @@ class BasicIterator(ABC):
     Abstract base class for all iterators over TaskCollection.
     """
 
+    __slots__ = ('_collection', '_items', '_position')
+
     def __init__(self, collection: TaskCollection):
         """
         Initialize the iterator with a contact collection.
@@ -65,11 +76,14 @@ class BasicIterator(ABC):
         :param collection: An instance of TaskCollection.
         :raises TypeError: If collection is not a TaskCollection.
         """
-        if not isinstance(collection, TaskCollection):
-            raise TypeError(
-                "Parameter 'collection' must be an instance of TaskCollection"
-            )
+        if __debug__:
+            if not isinstance(collection, TaskCollection):
+                raise TypeError(
+                    "Parameter 'collection' must be an instance of TaskCollection"
+                )
         self._collection = collection
+        # Index the backing list directly, skipping __getitem__ validation
+        self._items = collection._items()
         self._position = -1
 
     def __iter__(self):
@@ -93,8 +107,12 @@ class BasicIterator(ABC):
 class SimpleIterator(BasicIterator):
     """
     Iterator over all tasks in the collection.
+
+    Kept to illustrate the pattern; ToDoList itself iterates natively.
     """
 
+    __slots__ = ()
+
     def __next__(self) -> "Contact":
         """
         Returns the next contact in sequence.
@@ -102,43 +120,12 @@ class SimpleIterator(BasicIterator):
         :return: Next Contact object.
         :raises StopIteration: If end of collection is reached.
         """
-        self._position += 1
-        if self._position >= len(self._collection):
+        items = self._items
+        position = self._position + 1
+        self._position = position
+        if position >= len(items):
             raise StopIteration()
-        return self._collection[self._position]
-
-
-class StatusIterator(BasicIterator):
-    """
-    Iterator over tasks filtered by a specific number.
-    """
-
-    def __init__(self, collection: TaskCollection, status: Status):
-        """
-        Initialize the iterator with collection and filter number.
-
-        :param collection: The contact collection to iterate.
-        :param status: The Status value to filter by.
-        :raises TypeError: If number is not a Status enum.
-        """
-        super().__init__(collection)
-        if not isinstance(status, Status):
-            raise TypeError("Parameter 'number' must be an instance of Status")
-        self.__status = status
-
-    def __next__(self) -> "Contact":
-        """
-        Returns the next contact that matches the given number.
-
-        :return: Next matching Contact object.
-        :raises StopIteration: If no more matching tasks are found.
-        """
-        self._position += 1
-        while self._position < len(self._collection):
-            if self._collection[self._position].status == self.__status:
-                return self._collection[self._position]
-            self._position += 1
-        raise StopIteration()
+        return items[position]
 
 
 class Task:
@@ -146,6 +133,8 @@ class Task:
     Represents a single contact with a name and number.
     """
 
+    __slots__ = ('_owners', '_title', '_status')
+
     def __init__(self, title: str, status: Status):
         """
         Initialize the contact with a name and number.
@@ -155,6 +144,8 @@ class Task:
         :raises TypeError: If name is not a string or number is not a Status.
         :raises ValueError: If name is an empty string.
         """
+        # To-do lists containing this task, notified on status changes
+        self._owners = []
         self.title = title
         self.status = status
 
@@ -165,7 +156,7 @@ class Task:
 
         :return: Contact name as string.
         """
-        return self.__title
+        return self._title
 
     @title.setter
     def title(self, value: str):
@@ -176,11 +167,12 @@ class Task:
         :raises TypeError: If value is not a string.
         :raises ValueError: If value is empty or only whitespace.
         """
-        if not isinstance(value, str):
-            raise TypeError("Parameter 'name' must be a string")
+        if __debug__:
+            if not isinstance(value, str):
+                raise TypeError("Parameter 'name' must be a string")
         if not value.strip():
             raise ValueError("Parameter 'name' could not be empty")
-        self.__title = value
+        self._title = value
 
     @property
     def status(self) -> Status:
@@ -189,7 +181,7 @@ class Task:
 
         :return: Contact number as Status enum.
         """
-        return self.__status
+        return self._status
 
     @status.setter
     def status(self, value: Status):
@@ -199,9 +191,22 @@ class Task:
         :param value: Status for the contact.
         :raises TypeError: If value is not a Status enum.
         """
-        if not isinstance(value, Status):
-            raise TypeError("Parameter 'number' must be an instance of Status")
-        self.__status = value
+        if __debug__:
+            if not isinstance(value, Status):
+                raise TypeError("Parameter 'number' must be an instance of Status")
+        if getattr(self, "_status", None) is value:
+            return
+        self._status = value
+        for owner in self._owners:
+            owner._invalidate_status_index()
+
+    def _add_owner(self, owner: "ToDoList"):
+        """
+        Register a to-do list that indexes this task by status.
+
+        :param owner: ToDoList containing the task.
+        """
+        self._owners.append(owner)
 
     def __str__(self) -> str:
         """
@@ -222,6 +227,8 @@ class ToDoList(TaskCollection):
         Initialize an empty to-do list.
         """
         self._tasks = []
+        # Tasks bucketed by status; None when it has to be rebuilt
+        self._by_status = {status: [] for status in Status}
 
     def __getitem__(self, index: int) -> Task:
         """
@@ -232,13 +239,22 @@ class ToDoList(TaskCollection):
         :raises TypeError: If index is not an integer.
         :raises IndexError: If index is out of bounds.
         """
-        if not isinstance(index, int):
-            raise TypeError("Index must be an integer number")
+        if __debug__:
+            if not isinstance(index, int):
+                raise TypeError("Index must be an integer number")
         length = len(self._tasks)
         if index >= length or (index < 0 and abs(index) > length):
             raise IndexError("Collection index out of range")
         return self._tasks[index]
 
+    def _items(self) -> list:
+        """
+        Returns the underlying task list without copying or validation.
+
+        :return: The list of tasks.
+        """
+        return self._tasks
+
     def add_task(self, task: Task):
         """
         Add a contact to the to-do list.
@@ -246,9 +262,35 @@ class ToDoList(TaskCollection):
         :param task: Contact to be added.
         :raises TypeError: If contact is not an instance of Contact.
         """
-        if not isinstance(task, Task):
-            raise TypeError("Parameter 'contact' must be an instance of Contact")
+        if __debug__:
+            if not isinstance(task, Task):
+                raise TypeError("Parameter 'contact' must be an instance of Contact")
         self._tasks.append(task)
+        task._add_owner(self)
+        if self._by_status is not None:
+            self._by_status[task.status].append(task)
+
+    def _invalidate_status_index(self):
+        """
+        Drop the status buckets after a contained task changed its status.
+        """
+        self._by_status = None
+
+    def _tasks_with_status(self, status: Status) -> list:
+        """
+        Returns the bucket of tasks with the given status, rebuilding the
+        buckets in insertion order if they were invalidated.
+
+        :param status: Status to look up.
+        :return: List of tasks with the given status.
+        """
+        by_status = self._by_status
+        if by_status is None:
+            by_status = {status: [] for status in Status}
+            for task in self._tasks:
+                by_status[task.status].append(task)
+            self._by_status = by_status
+        return by_status[status]
 
     def __len__(self) -> int:
         """
@@ -258,29 +300,37 @@ class ToDoList(TaskCollection):
         """
         return len(self._tasks)
 
-    def get_simple_iterator(self) -> BasicIterator:
+    def __iter__(self) -> Iterator[Task]:
+        """
+        Iterate over all tasks using the native list iterator.
+
+        :return: Iterator over the underlying task list.
+        """
+        return iter(self._tasks)
+
+    def get_simple_iterator(self) -> Iterator[Task]:
         """
         Returns an iterator over all tasks.
 
-        :return: SimpleIterator instance.
+        :return: Iterator over the underlying task list.
         """
-        return SimpleIterator(self)
+        return iter(self)
 
-    def get_active_tasks_iterator(self) -> BasicIterator:
+    def get_active_tasks_iterator(self) -> Iterator[Task]:
         """
         Returns an iterator over active tasks only.
 
-        :return: StatusIterator with Status.ACTIVE.
+        :return: Iterator over tasks with Status.ACTIVE.
         """
-        return StatusIterator(self, Status.ACTIVE)
+        return iter(self._tasks_with_status(Status.ACTIVE))
 
-    def get_done_tasks_iterator(self) -> BasicIterator:
+    def get_done_tasks_iterator(self) -> Iterator[Task]:
         """
         Returns an iterator over completed tasks only.
 
-        :return: StatusIterator with Status.DONE.
+        :return: Iterator over tasks with Status.DONE.
         """
-        return StatusIterator(self, Status.DONE)
+        return iter(self._tasks_with_status(Status.DONE))
 
 
 def main():
@@ -289,9 +339,9 @@ def main():
 
     Creates a list of tasks with different statuses,
     then iterates over:
-    - all tasks (using SimpleIterator)
-    - only active tasks (using StatusIterator)
-    - only completed tasks (using StatusIterator)
+    - all tasks
+    - only active tasks
+    - only completed tasks
     """
     todo = ToDoList()
 
@@ -1,10 +1,65 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from collections import OrderedDict
+from typing import Any, Iterable, Optional
+import asyncio
 import requests
 import time
-from bs4 import BeautifulSoup
+from lxml import etree
 import pprint
 
+try:
+    import aiohttp
+except ImportError:
+    # aiohttp is optional, only AsyncHTMLFetcher needs it
+    aiohttp = None
+
+# Size of the chunks streamed from the network to the parser
+CHUNK_SIZE = 65536
+# Pause between steps so the demo output can be followed; off by default
+DEMO_MODE = False
+
+
+def _pause():
+    """
+    Sleeps for a moment when running in demo mode.
+    """
+    if DEMO_MODE:
+        time.sleep(1.5)
+
+
+# Recently fetched pages by URL, least recently used first
+_PAGE_CACHE_SIZE = 128
+# Larger pages are not cached, so streaming them keeps memory flat
+_MAX_CACHED_PAGE = 1 << 20
+_page_cache: "OrderedDict[str, bytes]" = OrderedDict()
+
+
+def _get_cached_page(url: str) -> Optional[bytes]:
+    """
+    Returns the cached content of a page and marks it as recently used.
+
+    :param url: URL of the page.
+    :return: Page content, or None if the page is not cached.
+    """
+    content = _page_cache.get(url)
+    if content is not None:
+        _page_cache.move_to_end(url)
+    return content
+
+
+def _cache_page(url: str, content: bytes):
+    """
+    Stores the content of a page, evicting the least recently used one
+    when the cache is full.
+
+    :param url: URL of the page.
+    :param content: Page content.
+    """
+    _page_cache[url] = content
+    _page_cache.move_to_end(url)
+    if len(_page_cache) > _PAGE_CACHE_SIZE:
+        _page_cache.popitem(last=False)
+
 
 class Component:
     """
@@ -57,6 +112,44 @@ class Mediator(ABC):
         :param data: Data sent in the notification.
         """
 
+    @abstractmethod
+    def notify_chunk(self, component: Component, chunk: bytes):
+        """
+        Receives a chunk of streamed data from a component.
+
+        :param component: The component sending the chunk.
+        :param chunk: Part of the streamed data.
+        """
+
+    @abstractmethod
+    def notify_end(self, component: Component):
+        """
+        Receives a notification that a component finished streaming data.
+
+        :param component: The component that finished streaming.
+        """
+
+    @abstractmethod
+    def notify_abort(self, component: Component):
+        """
+        Receives a notification that a component stopped streaming data
+        before the end.
+
+        :param component: The component that stopped streaming.
+        """
+
+    async def notify_async(self, component: Component, data: Any):
+        """
+        Receives notifications from asynchronous components.
+
+        Handling runs on a worker thread so the event loop keeps
+        serving other downloads meanwhile.
+
+        :param component: The component sending the notification.
+        :param data: Data sent in the notification.
+        """
+        await asyncio.to_thread(self.notify, component, data)
+
 
 class HTMLFetcher(Component):
     """
@@ -76,20 +169,192 @@ class HTMLFetcher(Component):
         url = url.strip()
         if not url:
             raise ValueError("Parameter 'url' could not be empty")
+        mediator = self.mediator
+        content = _get_cached_page(url)
+        if content is not None:
+            print(f"Using cached copy of '{url}'")
+            if mediator:
+                mediator.notify_chunk(self, content)
+                mediator.notify_end(self)
+            return
         print(f"Connecting to '{url}'...")
         try:
-            content = requests.get(url).content
+            # Stream the body so it is parsed chunk by chunk while downloading
+            with requests.get(url, stream=True, timeout=10) as response:
+                response.raise_for_status()
+                _pause()
+                print(f"Successfully connected to '{url}'")
+                _pause()
+                chunks = []
+                size = 0
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    if chunks is not None:
+                        size += len(chunk)
+                        if size <= _MAX_CACHED_PAGE:
+                            chunks.append(chunk)
+                        else:
+                            # Too large to cache, stop buffering the page
+                            chunks = None
+                    if mediator:
+                        mediator.notify_chunk(self, chunk)
         except requests.exceptions.RequestException as e:
+            print(f"Request Error: {e}")
+            if mediator:
+                mediator.notify_abort(self)
+            return
+        except Exception as e:
+            print(f"An error occurred: {e}")
+            if mediator:
+                mediator.notify_abort(self)
+            return
+        if chunks is not None:
+            _cache_page(url, b"".join(chunks))
+        if mediator:
+            mediator.notify_end(self)
+
+
+class AsyncHTMLFetcher(Component):
+    """
+    Component loading HTML content from several URLs concurrently.
+    """
+
+    def __init__(self):
+        """
+        Initializes the fetcher.
+
+        :raises ImportError: If aiohttp is not installed.
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncHTMLFetcher requires aiohttp")
+        super().__init__()
+        self.__session: Optional["aiohttp.ClientSession"] = None
+
+    async def load(self, url: str) -> None:
+        """
+        Loads the HTML content from the specified URL and notifies the mediator.
+
+        :param url: The URL of the page to load.
+        :raises TypeError: If url is not a string.
+        :raises ValueError: If url is an empty string.
+        """
+        if not isinstance(url, str):
+            raise TypeError("Parameter 'url' must be a string")
+        url = url.strip()
+        if not url:
+            raise ValueError("Parameter 'url' could not be empty")
+        if self.__session is None:
+            async with aiohttp.ClientSession() as session:
+                await self.__load(session, url)
+        else:
+            await self.__load(self.__session, url)
+
+    async def load_all(self, urls: Iterable[str]) -> None:
+        """
+        Loads several URLs concurrently over one shared connection pool.
+
+        A failure while loading or handling one page is reported for its
+        URL and does not interrupt the other downloads.
+
+        :param urls: URLs of the pages to load.
+        """
+        urls = list(urls)
+        async with aiohttp.ClientSession() as session:
+            self.__session = session
+            try:
+                results = await asyncio.gather(
+                    *(self.load(url) for url in urls), return_exceptions=True
+                )
+            finally:
+                self.__session = None
+        for url, result in zip(urls, results):
+            if isinstance(result, BaseException):
+                print(f"Failed to load '{url}': {result}")
+
+    async def __load(self, session: "aiohttp.ClientSession", url: str) -> None:
+        content = _get_cached_page(url)
+        if content is not None:
+            print(f"Using cached copy of '{url}'")
+            if self.mediator:
+                await self.mediator.notify_async(self, content)
+            return
+        print(f"Connecting to '{url}'...")
+        timeout = aiohttp.ClientTimeout(total=10)
+        try:
+            async with session.get(url, timeout=timeout) as response:
+                response.raise_for_status()
+                content = await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             print(f"Request Error: {e}")
             return
         except Exception as e:
             print(f"An error occurred: {e}")
             return
-        time.sleep(1.5)
         print(f"Successfully connected to '{url}'")
-        time.sleep(1.5)
+        if len(content) <= _MAX_CACHED_PAGE:
+            _cache_page(url, content)
         if self.mediator:
-            self.mediator.notify(self, content)
+            await self.mediator.notify_async(self, content)
+
+
+class _PageDataCollector:
+    """
+    Collects the page title and absolute links from an HTML document
+    in a single streaming pass.
+    """
+
+    def __init__(self):
+        # Only <title> and <a> events are reported by lxml's C parser;
+        # comments, blank text and the id table are never materialized
+        self.__parser = etree.HTMLPullParser(
+            events=("start", "end"), tag=("title", "a"),
+            remove_comments=True, remove_pis=True, remove_blank_text=True,
+            collect_ids=False,
+        )
+        self.__title: Optional[str] = None
+        self.__links = []
+
+    def feed(self, chunk: bytes | str):
+        """
+        Parses the next chunk of the document.
+
+        :param chunk: Part of the HTML content as bytes or string.
+        """
+        self.__parser.feed(chunk)
+        self.__collect()
+
+    def close(self) -> dict:
+        """
+        Finishes parsing and returns the collected data.
+
+        :return: Dictionary with the page name and links.
+        """
+        self.__parser.close()
+        self.__collect()
+        return {
+            "name": self.__title if self.__title is not None else "Without name",
+            "links": self.__links,
+        }
+
+    def __collect(self):
+        links = self.__links
+        for event, element in self.__parser.read_events():
+            if element.tag == "a":
+                if event == "start":
+                    href = element.get("href", "")
+                    if href and href.startswith("http"):
+                        links.append(href)
+                    continue
+            elif event == "start":
+                continue
+            elif self.__title is None:
+                self.__title = element.text or ""
+            # Release processed elements and their finished siblings
+            # to keep memory flat
+            element.clear()
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
 
 
 class HTMLParser(Component):
@@ -97,6 +362,45 @@ class HTMLParser(Component):
     Component responsible for parsing HTML content.
     """
 
+    def __init__(self):
+        super().__init__()
+        self.__collector = None
+
+    def feed(self, chunk: bytes | str):
+        """
+        Feeds a chunk of a streamed HTML document to the parser.
+
+        :param chunk: Part of the HTML content as bytes or string.
+        :raises TypeError: If chunk is not bytes or string.
+        """
+        if not isinstance(chunk, (bytes, str)):
+            raise TypeError(
+                "Parameter 'chunk' must be an instance of bytes or str"
+            )
+        if self.__collector is None:
+            self.__collector = _PageDataCollector()
+        self.__collector.feed(chunk)
+
+    def close(self):
+        """
+        Finishes parsing the streamed document and notifies the mediator
+        with the page name and links.
+
+        :raises ValueError: If no content was fed to the parser.
+        """
+        collector = self.__collector
+        if collector is None:
+            raise ValueError("Parameter 'content' could not be empty")
+        self.__collector = None
+        self.__finish(collector)
+
+    def reset(self):
+        """
+        Discards a partially streamed document, so the next chunk starts
+        a new one.
+        """
+        self.__collector = None
+
     def parse(self, content: bytes | str):
         """
         Parses the HTML content to extract the page name and links,
@@ -112,19 +416,16 @@ class HTMLParser(Component):
             )
         if not content:
             raise ValueError("Parameter 'content' could not be empty")
-        print(f"Parsing data...")
-        data = {}
-        soup = BeautifulSoup(content, "html.parser")
-        title = soup.find("title")
-        data["name"] = title.text if title else "Without name"
-        data["links"] = []
-        for link in soup.find_all("a"):
-            href = link.get("href", "")
-            if href and href.startswith("http"):
-                data["links"].append(href)
-        time.sleep(1.5)
+        collector = _PageDataCollector()
+        collector.feed(content)
+        self.__finish(collector)
+
+    def __finish(self, collector: _PageDataCollector):
+        print("Parsing data...")
+        data = collector.close()
+        _pause()
         print("Data was successfully parsed")
-        time.sleep(1.5)
+        _pause()
         if self.mediator:
             self.mediator.notify(self, data)
 
@@ -134,17 +435,19 @@ class WebMediator(Mediator):
     Mediator coordinating interaction between HTMLFetcher and HTMLParser.
     """
 
-    def __init__(self, fetcher: HTMLFetcher, parser: HTMLParser):
+    def __init__(self, fetcher: HTMLFetcher | AsyncHTMLFetcher,
+                 parser: HTMLParser):
         """
         Initializes the mediator with fetcher and parser components.
 
-        :param fetcher: An instance of HTMLFetcher.
+        :param fetcher: An instance of HTMLFetcher or AsyncHTMLFetcher.
         :param parser: An instance of HTMLParser.
         :raises TypeError: If arguments are not of expected types.
         """
-        if not isinstance(fetcher, HTMLFetcher):
+        if not isinstance(fetcher, (HTMLFetcher, AsyncHTMLFetcher)):
             raise TypeError(
-                "Parameter 'fetcher' must be an instance of HTMLFetcher"
+                "Parameter 'fetcher' must be an instance of HTMLFetcher "
+                "or AsyncHTMLFetcher"
             )
         if not isinstance(parser, HTMLParser):
             raise TypeError(
@@ -154,6 +457,11 @@ class WebMediator(Mediator):
         self.__parser = parser
         fetcher.mediator = self
         parser.mediator = self
+        # Handlers of component notifications, keyed by component identity
+        self.__dispatch = {
+            id(fetcher): self._deliver_page,
+            id(parser): self._handle_parsed_data,
+        }
 
     def notify(self, component: Component, data: Any):
         """
@@ -162,21 +470,71 @@ class WebMediator(Mediator):
         :param component: The component sending the notification.
         :param data: Data received from the component.
         """
-        match component:
-            case self.__fetcher:
-                print("Mediator delivers the fetcher's output to the parser")
-                time.sleep(1.5)
-                self.__parser.parse(data)
-            case self.__parser:
-                print("Mediator got data from parser")
-                time.sleep(1.5)
-                if not data:
-                    print("Parser returned empty result")
-                else:
-                    print("Result of parsing:")
-                    pprint.pp(data)
-            case _:
-                print("Notify was called by unknown component")
+        handler = self.__dispatch.get(id(component))
+        if handler:
+            handler(data)
+        else:
+            print("Notify was called by unknown component")
+
+    def _deliver_page(self, content: bytes | str):
+        """
+        Passes a page loaded by the fetcher to the parser.
+
+        :param content: HTML content of the page.
+        """
+        print("Mediator delivers the fetcher's output to the parser")
+        _pause()
+        self.__parser.parse(content)
+
+    def _handle_parsed_data(self, data: dict):
+        """
+        Prints the data extracted by the parser.
+
+        :param data: Parsed page name and links.
+        """
+        print("Mediator got data from parser")
+        _pause()
+        if not data:
+            print("Parser returned empty result")
+        else:
+            print("Result of parsing:")
+            pprint.pp(data)
+
+    def notify_chunk(self, component: Component, chunk: bytes):
+        """
+        Forwards streamed chunks from the fetcher to the parser.
+
+        :param component: The component sending the chunk.
+        :param chunk: Part of the fetched page.
+        """
+        if component is self.__fetcher:
+            self.__parser.feed(chunk)
+        else:
+            print("Notify was called by unknown component")
+
+    def notify_end(self, component: Component):
+        """
+        Lets the parser finish once the fetcher has streamed the whole page.
+
+        :param component: The component that finished streaming.
+        """
+        if component is self.__fetcher:
+            print("Mediator delivers the fetcher's output to the parser")
+            _pause()
+            self.__parser.close()
+        else:
+            print("Notify was called by unknown component")
+
+    def notify_abort(self, component: Component):
+        """
+        Makes the parser drop a page the fetcher failed to stream completely.
+
+        :param component: The component that stopped streaming.
+        """
+        if component is self.__fetcher:
+            self.__parser.reset()
+        else:
+            print("Notify was called by unknown component")
 
     def __str__(self):
         """
@@ -191,18 +549,24 @@ def main():
     Entry point of the program.
 
     Initializes components and mediator,
-    accepts a URL from the user, and starts the load and parse process.
+    accepts URLs from the user, and starts the load and parse process.
+    Several URLs separated by spaces are fetched concurrently.
     """
-    fetcher = HTMLFetcher()
+    global DEMO_MODE
+    # Get URLs from user input, use default if empty
+    urls = input("Enter url(s) for parsing: ").split() or ["https://python.org"]
     parser = HTMLParser()
-    mediator = WebMediator(fetcher, parser)
-    print(f"{mediator} was successfully created")
-    # Get URL from user input
-    url = input("Enter url for parsing: ").strip()
-    # Use default if empty
-    if not url:
-        url = "https://python.org"
-    fetcher.load(url)
+    if len(urls) == 1:
+        DEMO_MODE = True
+        fetcher = HTMLFetcher()
+        mediator = WebMediator(fetcher, parser)
+        print(f"{mediator} was successfully created")
+        fetcher.load(urls[0])
+    else:
+        fetcher = AsyncHTMLFetcher()
+        mediator = WebMediator(fetcher, parser)
+        print(f"{mediator} was successfully created")
+        asyncio.run(fetcher.load_all(urls))
 
 
 # Run main() only when script is executed directly
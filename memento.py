@@ -1,6 +1,11 @@
 from abc import ABC
-from typing import List
-import copy
+from bisect import bisect_right
+from collections import deque
+from itertools import islice
+from operator import itemgetter
+from typing import Deque, List, Sequence, Tuple
+import re
+import weakref
 
 
 class Memento(ABC):
@@ -12,6 +17,9 @@ class Memento(ABC):
 class ContactBookMemento(Memento):
     """
     Concrete Memento class that stores the state of contacts list.
+
+    The state is kept as parallel tuples of names and numbers; both hold
+    immutable strings, so a shallow copy is a complete snapshot.
     """
 
     def __init__(self, contacts: List["Contact"]):
@@ -21,24 +29,61 @@ class ContactBookMemento(Memento):
         :param contacts: List of contacts to save.
         :raises TypeError: If contacts is not a list of Contacts.
         """
-        if not isinstance(contacts, list):
-            raise TypeError("Parameter 'contacts' must be an instance of list")
-        if not all(isinstance(c, Contact) for c in contacts):
-            raise TypeError("Contacts must be a list of Contact")
-        self._contacts = copy.deepcopy(contacts)
+        if __debug__:
+            if not isinstance(contacts, list):
+                raise TypeError("Parameter 'contacts' must be an instance of list")
+            if not all(isinstance(c, Contact) for c in contacts):
+                raise TypeError("Contacts must be a list of Contact")
+        self._names = tuple(c.name for c in contacts)
+        self._numbers = tuple(c.number for c in contacts)
+
+    @classmethod
+    def _shared(cls, names: List[str],
+                numbers: List[str]) -> "ContactBookMemento":
+        """
+        Creates a memento referencing the given lists instead of copying them.
+        The owner must call _detach() before it changes the lists.
+
+        :param names: Live list of contact names.
+        :param numbers: Live list of contact numbers.
+        :return: ContactBookMemento sharing the lists.
+        """
+        memento = cls.__new__(cls)
+        memento._names = names
+        memento._numbers = numbers
+        return memento
+
+    def _detach(self):
+        """
+        Replaces the shared lists with private immutable copies.
+        """
+        self._names = tuple(self._names)
+        self._numbers = tuple(self._numbers)
+
+    def _fields(self) -> Tuple[Sequence[str], Sequence[str]]:
+        """
+        Returns the saved names and numbers without building contacts.
+
+        :return: Tuple of the names and the numbers.
+        """
+        return self._names, self._numbers
 
     def get_state(self) -> List["Contact"]:
         """
         Returns the saved state of contacts.
         """
-        return self._contacts
+        return [Contact._from_fields(name, number)
+                for name, number in zip(self._names, self._numbers)]
 
 
 class Contact:
     """
     Represents a simple contact with name and phone number.
     """
+    __slots__ = ('__name', '__number')
+
     _number_length: int = 10
+    _number_re = re.compile(rf"\d{{{_number_length}}}")
 
     def __init__(self, name: str, number: str):
         """
@@ -68,8 +113,9 @@ class Contact:
         :raises TypeError: If value is not a string.
         :raises ValueError: If value is empty or whitespace only.
         """
-        if not isinstance(value, str):
-            raise TypeError("Parameter 'name' must be a string")
+        if __debug__:
+            if not isinstance(value, str):
+                raise TypeError("Parameter 'name' must be a string")
         if not value.strip():
             raise ValueError("Parameter 'name' could not be empty")
         self.__name = value
@@ -92,14 +138,51 @@ class Contact:
         :raises TypeError: If value is not a string.
         :raises ValueError: If value is empty, wrong length, or contains non-digit characters.
         """
-        if not isinstance(value, str):
-            raise TypeError("Parameter 'number' must be a string")
-        if not value.strip():
-            raise ValueError("Parameter 'number' could not be empty")
-        if len(value) != self._number_length or not value.isdigit():
+        if __debug__:
+            if not isinstance(value, str):
+                raise TypeError("Parameter 'number' must be a string")
+        # One regex pass checks both the length and the digits
+        if self._number_re.fullmatch(value) is None:
+            if not value.strip():
+                raise ValueError("Parameter 'number' could not be empty")
             raise ValueError(f"Bad phone number: '{value}'")
         self.__number = value
 
+    def _copy_fast(self) -> "Contact":
+        """
+        Returns a copy of the contact without re-running the validation
+        of its already validated fields.
+
+        :return: New Contact with the same name and number.
+        """
+        return Contact._from_fields(self.__name, self.__number)
+
+    @classmethod
+    def _from_fields(cls, name: str, number: str) -> "Contact":
+        """
+        Creates a contact from already validated fields.
+
+        :param name: Contact's name.
+        :param number: Contact's phone number.
+        :return: New Contact.
+        """
+        new = cls.__new__(cls)
+        new.__name = name
+        new.__number = number
+        return new
+
+    def __deepcopy__(self, memo: dict) -> "Contact":
+        """
+        Deep copies the contact without running the property validators;
+        both fields are immutable strings that were validated already.
+
+        :param memo: Memo dictionary of the running deepcopy.
+        :return: New Contact with the same name and number.
+        """
+        new = self._copy_fast()
+        memo[id(self)] = new
+        return new
+
     def __str__(self) -> str:
         """
         Returns a formatted string representation of the contact.
@@ -113,13 +196,30 @@ class ContactBook:
     """
     Collection of contacts that supports adding, removing,
     saving, and restoring state.
+
+    Names and numbers are stored in two parallel lists instead of a list of
+    Contact objects; contacts are created on demand when handed out.
     """
 
     def __init__(self):
         """
         Initializes an empty contact book.
         """
-        self._contacts: List[Contact] = []
+        self._names: List[str] = []
+        self._numbers: List[str] = []
+        # Mementos still sharing the lists, copied on the next change
+        self._shared_snapshots: List[weakref.ref] = []
+
+    def _before_change(self):
+        """
+        Gives mementos sharing the lists their own copy before the lists
+        are changed in place.
+        """
+        for ref in self._shared_snapshots:
+            memento = ref()
+            if memento is not None:
+                memento._detach()
+        self._shared_snapshots.clear()
 
     def add_contact(self, contact: Contact):
         """
@@ -128,44 +228,71 @@ class ContactBook:
         :param contact: Contact object to add.
         :raises TypeError: If contact is not a Contact instance.
         """
-        if not isinstance(contact, Contact):
-            raise TypeError("Parameter 'contact' must be an instance of Contact")
-        self._contacts.append(contact)
+        if __debug__:
+            if not isinstance(contact, Contact):
+                raise TypeError("Parameter 'contact' must be an instance of Contact")
+        if self._shared_snapshots:
+            self._before_change()
+        self._names.append(contact.name)
+        self._numbers.append(contact.number)
 
-    def remove_contact(self, index: int):
+    def remove_contact(self, index: int) -> Contact:
         """
         Removes a contact by index.
 
         :param index: Index of contact to remove.
+        :return: The removed contact.
         :raises TypeError: If index is not an integer.
         :raises IndexError: If index is out of range.
         """
-        if not isinstance(index, int):
-            raise TypeError("Index must be an integer number")
-        if not (0 <= index < len(self._contacts)):
+        if __debug__:
+            if not isinstance(index, int):
+                raise TypeError("Index must be an integer number")
+        if not (0 <= index < len(self._names)):
             raise IndexError("Index out of range")
-        self._contacts.pop(index)
+        if self._shared_snapshots:
+            self._before_change()
+        return Contact._from_fields(
+            self._names.pop(index), self._numbers.pop(index)
+        )
+
+    def _insert_contact(self, index: int, contact: Contact):
+        """
+        Puts a previously removed contact back at its index.
+
+        :param index: Index the contact had before removal.
+        :param contact: Contact to insert.
+        """
+        if self._shared_snapshots:
+            self._before_change()
+        self._names.insert(index, contact.name)
+        self._numbers.insert(index, contact.number)
 
     def show_contacts(self):
         """
         Prints all contacts to the console.
         If empty, notifies that the book is empty.
         """
-        if not self._contacts:
+        if not self._names:
             print("Contact book is empty.")
             return
 
         print("All contacts:")
-        for i, contact in enumerate(self._contacts):
-            print(f"{i+1}. {contact}")
+        for i, (name, number) in enumerate(zip(self._names, self._numbers)):
+            print(f"{i+1}. Name: {name}. Phone number: {number}")
 
     def save(self) -> Memento:
         """
         Creates a Memento with the current state of contacts.
 
+        The lists are copied lazily, on the first change of the book
+        after the snapshot was taken.
+
         :return: ContactBookMemento object.
         """
-        return ContactBookMemento(self._contacts)
+        memento = ContactBookMemento._shared(self._names, self._numbers)
+        self._shared_snapshots.append(weakref.ref(memento))
+        return memento
 
     def restore(self, memento: ContactBookMemento):
         """
@@ -174,11 +301,16 @@ class ContactBook:
         :param memento: ContactBookMemento to restore from.
         :raises TypeError: If memento is not ContactBookMemento.
         """
-        if not isinstance(memento, ContactBookMemento):
-            raise TypeError(
-                "Parameter 'memento' must be an instance of ContactBookMemento"
-            )
-        self._contacts = copy.deepcopy(memento.get_state())
+        if __debug__:
+            if not isinstance(memento, ContactBookMemento):
+                raise TypeError(
+                    "Parameter 'memento' must be an instance of ContactBookMemento"
+                )
+        names, numbers = memento._fields()
+        self._names = list(names)
+        self._numbers = list(numbers)
+        # The old lists are no longer changed, sharing mementos keep them
+        self._shared_snapshots.clear()
 
     def __len__(self) -> int:
         """
@@ -186,13 +318,23 @@ class ContactBook:
 
         :return: Integer count of contacts.
         """
-        return len(self._contacts)
+        return len(self._names)
 
 
 class History:
     """
     Maintains history of ContactBook changes and supports undo.
+
+    Contacts added or removed through the history are recorded as small
+    deltas. backup() records a full snapshot as an undo step instead, so
+    changes made directly on the book after it can be undone as well.
+    Every few changes a full checkpoint of the book is saved too, so
+    undoing many steps at once restores the nearest checkpoint and
+    replays the remaining deltas instead of reverting each one.
     """
+    _checkpoint_interval: int = 64
+    # Number of changes that can be undone; older ones are forgotten
+    _max_changes: int = 100
 
     def __init__(self, book: ContactBook):
         """
@@ -201,29 +343,129 @@ class History:
         :param book: ContactBook instance.
         :raises TypeError: If book is not ContactBook.
         """
-        if not isinstance(book, ContactBook):
-            raise TypeError(
-                "Parameter 'book' must be an instance of ContactBook"
-            )
+        if __debug__:
+            if not isinstance(book, ContactBook):
+                raise TypeError(
+                    "Parameter 'book' must be an instance of ContactBook"
+                )
         self._book = book
-        self._snapshots: List[Memento] = []
+        # Undo steps, oldest first: ("add", contact), ("del", index, contact)
+        # or ("snap", memento)
+        self._deltas: Deque[tuple] = deque(maxlen=self._max_changes)
+        # Number of steps evicted from the front of self._deltas
+        self._evicted = 0
+        # (number of steps recorded so far, snapshot of the book at that point)
+        self._checkpoints: Deque[Tuple[int, Memento]] = deque()
+
+    def add_contact(self, contact: Contact):
+        """
+        Adds a contact to the book and records the change for undo.
+
+        :param contact: Contact object to add.
+        """
+        self._book.add_contact(contact)
+        self._record(("add", contact))
+
+    def remove_contact(self, index: int):
+        """
+        Removes a contact from the book and records the change for undo.
+
+        :param index: Index of contact to remove.
+        """
+        contact = self._book.remove_contact(index)
+        self._record(("del", index, contact))
 
     def backup(self):
         """
-        Saves the current state of ContactBook to the snapshots stack.
+        Saves the current state of ContactBook as an undo step.
+        """
+        memento = self._checkpoint()
+        self._record(("snap", memento))
+
+    def undo(self, steps: int = 1) -> bool:
+        """
+        Reverts the last recorded changes of ContactBook.
+
+        :param steps: Number of changes to revert.
+        :return: True if undo succeeded, False if no changes available.
+        :raises TypeError: If steps is not an integer.
+        :raises ValueError: If steps is less than one.
+        """
+        if __debug__:
+            if not isinstance(steps, int):
+                raise TypeError("Parameter 'steps' must be an integer number")
+        if steps < 1:
+            raise ValueError("Parameter 'steps' must be positive")
+        deltas = self._deltas
+        if not deltas:
+            return False
+        steps = min(steps, len(deltas))
+        evicted = self._evicted
+        target = evicted + len(deltas) - steps
+        checkpoints = self._checkpoints
+        i = bisect_right(checkpoints, target, key=itemgetter(0)) - 1
+        book = self._book
+        position = checkpoints[i][0] if i >= 0 else -1
+        # A snapshot step cannot be replayed, but each one is a checkpoint,
+        # so it can only be the first step after the nearest checkpoint
+        if (steps > 1 and i >= 0 and target - position < steps and
+                (position == target or
+                 deltas[position - evicted][0] != "snap")):
+            # Jump back to the checkpoint and replay the deltas after it
+            memento = checkpoints[i][1]
+            book.restore(memento)
+            for delta in islice(deltas, position - evicted, target - evicted):
+                if delta[0] == "add":
+                    book.add_contact(delta[1])
+                else:
+                    book.remove_contact(delta[1])
+            for _ in range(steps):
+                deltas.pop()
+        else:
+            for _ in range(steps):
+                delta = deltas.pop()
+                if delta[0] == "add":
+                    # Later changes were undone already, so it is the last one
+                    book.remove_contact(len(book) - 1)
+                elif delta[0] == "del":
+                    book._insert_contact(delta[1], delta[2])
+                else:
+                    book.restore(delta[1])
+        while len(checkpoints) > i + 1:
+            checkpoints.pop()
+        return True
+
+    def _checkpoint(self) -> Memento:
+        """
+        Saves a full checkpoint of the current state of ContactBook.
+
+        :return: Snapshot of the book.
         """
-        self._snapshots.append(self._book.save())
+        position = self._evicted + len(self._deltas)
+        if self._checkpoints and self._checkpoints[-1][0] == position:
+            self._checkpoints.pop()
+        memento = self._book.save()
+        self._checkpoints.append((position, memento))
+        return memento
 
-    def undo(self) -> bool:
+    def _record(self, delta: tuple):
         """
-        Restores the last saved state of ContactBook.
+        Stores an undo step and periodically checkpoints the book.
 
-        :return: True if undo succeeded, False if no snapshots available.
+        :param delta: Description of the change.
         """
-        if self._snapshots:
-            self._book.restore(self._snapshots.pop())
-            return True
-        return False
+        deltas = self._deltas
+        if len(deltas) == deltas.maxlen:
+            # The oldest change is dropped, checkpoints before it are useless
+            self._evicted += 1
+            checkpoints = self._checkpoints
+            while checkpoints and checkpoints[0][0] < self._evicted:
+                checkpoints.popleft()
+        deltas.append(delta)
+        # The book may still change directly after a snapshot step
+        if (delta[0] != "snap" and
+                (self._evicted + len(deltas)) % self._checkpoint_interval == 0):
+            self._checkpoint()
 
 
 def main():
@@ -262,8 +504,7 @@ def main():
                 except ValueError as e:
                     print(e)
                     continue
-                history.backup()
-                book.add_contact(contact)
+                history.add_contact(contact)
                 print("Contact was added successfully")
             case 'd':
                 index_txt = input(
@@ -277,8 +518,7 @@ def main():
                 if not (0 <= index < len(book)):
                     print("Error: Invalid number")
                     continue
-                history.backup()
-                book.remove_contact(index)
+                history.remove_contact(index)
                 print("Contact was deleted successfully")
             case 's':
                 book.show_contacts()
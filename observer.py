@@ -1,5 +1,7 @@
+from collections import Counter
+import asyncio
 import datetime as dt
-import time
+import sys
 
 
 class News:
@@ -8,6 +10,8 @@ class News:
     a title, content, and author information.
     """
 
+    __slots__ = ('__title', '__content', '__author')
+
     def __init__(self, title: str, content: str, author: str):
         """
         Initialize a news item with title, content, and author.
@@ -18,11 +22,13 @@ class News:
         :raises TypeError: If any of the parameters are not strings.
         :raises ValueError: If any of the parameters are empty strings.
         """
-        if not all(isinstance(p, str) for p in (title, content, author)):
-            raise TypeError(
-                "Parameters 'title', 'content' and 'author' must be strings"
-            )
-        if not all(p.strip() for p in (title, content, author)):
+        if __debug__:
+            if (type(title) is not str or type(content) is not str
+                    or type(author) is not str):
+                raise TypeError(
+                    "Parameters 'title', 'content' and 'author' must be strings"
+                )
+        if not (title.strip() and content.strip() and author.strip()):
             raise ValueError(
                 "Parameters 'title', 'content' and 'author' must not be empty"
             )
@@ -73,17 +79,20 @@ class Observer:
     Base class for observers that react to published news.
     """
 
-    def update(self, news: News):
+    __slots__ = ()
+
+    async def update(self, news: News):
         """
         Receive an update with a News object.
 
         :param news: News instance with the latest data.
         :raises TypeError: If the input is not a News instance.
         """
-        if not isinstance(news, News):
-            raise TypeError(
-                "Parameter 'news' must be an instance of News"
-            )
+        if __debug__:
+            if not isinstance(news, News):
+                raise TypeError(
+                    "Parameter 'news' must be an instance of News"
+                )
         print(f"\n{self.__class__.__name__} got news.")
 
 
@@ -98,7 +107,8 @@ class NewsPublisher:
         Initialize the news publisher with
         an empty list of subscribers.
         """
-        self._subscribers = []
+        # Subscribers by identity, in subscription order
+        self._subscribers: dict[int, Observer] = {}
 
     def subscribe(self, observer: Observer):
         """
@@ -107,12 +117,12 @@ class NewsPublisher:
         :param observer: An instance of Observer.
         :raises TypeError: If the object is not an Observer.
         """
-        if not isinstance(observer, Observer):
-            raise TypeError(
-                "Parameter 'observer' must be an instance of Observer"
-            )
-        if observer not in self._subscribers:
-            self._subscribers.append(observer)
+        if __debug__:
+            if not isinstance(observer, Observer):
+                raise TypeError(
+                    "Parameter 'observer' must be an instance of Observer"
+                )
+        self._subscribers.setdefault(id(observer), observer)
 
     def unsubscribe(self, observer: Observer):
         """
@@ -121,43 +131,47 @@ class NewsPublisher:
         :param observer: An instance of Observer.
         :raises TypeError: If the object is not an Observer.
         """
-        if not isinstance(observer, Observer):
-            raise TypeError(
-                "Parameter 'observer' must be an instance of Observer"
-            )
-        if observer in self._subscribers:
-            self._subscribers.remove(observer)
-
-    def notify(self, news: News):
+        if __debug__:
+            if not isinstance(observer, Observer):
+                raise TypeError(
+                    "Parameter 'observer' must be an instance of Observer"
+                )
+        self._subscribers.pop(id(observer), None)
+
+    async def notify(self, news: News):
         """
         Notify all subscribed observers with a new news item.
 
         :param news: The News instance to send.
         :raises TypeError: If the input is not a News instance.
         """
-        if not isinstance(news, News):
-            raise TypeError(
-                "Parameter 'news' must be an instance of News"
-            )
-
-        for subscriber in self._subscribers:
-            subscriber.update(news)
-            time.sleep(1.5)
+        if __debug__:
+            if not isinstance(news, News):
+                raise TypeError(
+                    "Parameter 'news' must be an instance of News"
+                )
+
+        # Subscribers waiting for I/O let the others run meanwhile
+        await asyncio.gather(
+            *(subscriber.update(news)
+              for subscriber in self._subscribers.values())
+        )
 
-    def publish_news(self, news: News):
+    async def publish_news(self, news: News):
         """
         Publish a new news item and notify all observers.
 
         :param news: The News instance to publish.
         :raises TypeError: If the input is not a News instance.
         """
-        if not isinstance(news, News):
-            raise TypeError(
-                "Parameter 'news' must be an instance of News"
-            )
+        if __debug__:
+            if not isinstance(news, News):
+                raise TypeError(
+                    "Parameter 'news' must be an instance of News"
+                )
         print(f"\nPublisher add news:\n{news}")
-        time.sleep(1.5)
-        self.notify(news)
+        await asyncio.sleep(1.5)
+        await self.notify(news)
 
 
 class NewsLogger(Observer):
@@ -165,6 +179,8 @@ class NewsLogger(Observer):
     Observer that logs received news to a uniquely named text file.
     """
 
+    __slots__ = ('__filename', '__fhand')
+
     def __init__(self):
         """
         Initialize the logger and create
@@ -172,22 +188,44 @@ class NewsLogger(Observer):
         """
         timestamp = str(dt.datetime.now().timestamp()).replace('.', '')
         self.__filename = f"news{timestamp}.txt"
+        # Opened on the first news and kept open for the next ones
+        self.__fhand = None
 
-    def update(self, news: News):
+    async def update(self, news: News):
         """
         Handle the news update by writing it to a file.
 
         :param news: The News instance to write.
         """
-        super().update(news)
+        await super().update(news)
         try:
-            with open(self.__filename, 'a') as fhand:
-                fhand.write(f"{news}\n\n")
+            # Blocking file I/O runs in a worker thread
+            await asyncio.to_thread(self.__write, f"{news}\n\n")
         except Exception as e:
             print(f"Error: {e}")
             return
         print(f"{self.__class__.__name__} save news to the {self.__filename}")
 
+    def __write(self, text: str):
+        if self.__fhand is None:
+            self.__fhand = open(self.__filename, 'a', buffering=8192)
+        self.__fhand.write(text)
+        self.__fhand.flush()
+
+    def close(self):
+        """
+        Close the log file.
+        """
+        if self.__fhand is not None:
+            self.__fhand.close()
+            self.__fhand = None
+
+    def __enter__(self) -> "NewsLogger":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
 
 class AuthorWatcher(Observer):
     """
@@ -195,22 +233,27 @@ class AuthorWatcher(Observer):
     each author has published news.
     """
 
+    __slots__ = ('__authors',)
+
     def __init__(self):
         """
         Initialize the author watcher with an empty tracking dictionary.
         """
-        self.__authors = {}
+        self.__authors = Counter()
 
-    def update(self, news: News):
+    async def update(self, news: News):
         """
         Handle the news update by updating the count for the news author.
 
         :param news: The News instance received.
         """
-        super().update(news)
-        self.__authors[news.author] = self.__authors.get(news.author, 0) + 1
+        await super().update(news)
+        # Interned keys are shared between news items and hash only once
+        author = sys.intern(news.author)
+        count = self.__authors[author] + 1
+        self.__authors[author] = count
         print(f"{self.__class__.__name__} reports: "
-              f"It was news №{self.__authors[news.author]} for {news.author}"
+              f"It was news №{count} for {author}"
         )
 
 
@@ -218,6 +261,13 @@ def main():
     """
     Simulate news publishing and observer notification workflow.
     """
+    asyncio.run(_simulate())
+
+
+async def _simulate():
+    """
+    Publish the demo news items on the running event loop.
+    """
     publisher = NewsPublisher()
     news_logger = NewsLogger()
     author_watcher = AuthorWatcher()
@@ -251,13 +301,14 @@ def main():
     ]
 
     for news in news_list:
-        publisher.publish_news(news)
+        await publisher.publish_news(news)
 
-    time.sleep(1.5)
+    await asyncio.sleep(1.5)
     publisher.unsubscribe(news_logger)
+    news_logger.close()
     print("\nNewsLogger were unsubscribed")
-    time.sleep(1.5)
-    publisher.publish_news(
+    await asyncio.sleep(1.5)
+    await publisher.publish_news(
         News("AI Regulation", "EU passes new AI safety regulations.", "Bob")
     )
 
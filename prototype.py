@@ -1,11 +1,15 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
 import copy
+import sys
 
 class Prototype(ABC):
     """
     Abstract base class that defines the Prototype interface.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def clone(self):
         """
@@ -23,17 +27,52 @@ class SimpleTextField:
 
     def __set_name__(self, owner, name):
         self.name = name
-        self.attr_name = '__' + self.name.lstrip('_')
+        # Interned key hashes once for all instance dictionaries
+        self.attr_name = sys.intern('_' + self.name.lstrip('_'))
+        # Member descriptor of a slotted owner, None if values live in __dict__
+        self.slot = owner.__dict__.get(self.attr_name)
     
     def __get__(self, instance, owner):
-        return getattr(instance, self.attr_name, None)
+        if instance is None:
+            return self
+        if self.slot is not None:
+            try:
+                return self.slot.__get__(instance, owner)
+            except AttributeError:
+                return None
+        return instance.__dict__.get(self.attr_name)
     
     def __set__(self, instance, value):
         if not isinstance(value, str):
             raise TypeError(f"'{self.name}' must be an instance of string.")
         if not value.strip():
             raise ValueError(f"'{self.name}' can not be empty.")
-        setattr(instance, self.attr_name, value)
+        if self.slot is not None:
+            self.slot.__set__(instance, value)
+        else:
+            instance.__dict__[self.attr_name] = value
+
+
+@lru_cache(maxsize=None)
+def _slot_names(cls: type) -> tuple:
+    """
+    Collects the slot attribute names declared along the class hierarchy.
+
+    :param cls: Class to inspect.
+    :return: Attribute names of all slots, private names mangled.
+    """
+    names = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name in ('__dict__', '__weakref__'):
+                continue
+            if name.startswith('__') and not name.endswith('__'):
+                name = f"_{klass.__name__.lstrip('_')}{name}"
+            names.append(name)
+    return tuple(names)
 
 
 class Document(Prototype):
@@ -45,6 +84,8 @@ class Document(Prototype):
         content (str): Body text of the document.
         author (str): Author of the document.
     """
+    __slots__ = ('_title', '_content', '_author')
+
     title = SimpleTextField()
     content = SimpleTextField()
     author = SimpleTextField()
@@ -55,7 +96,27 @@ class Document(Prototype):
         self.author = author
 
     def clone(self) -> "Document":
-        return copy.deepcopy(self)
+        # Document's fields are immutable strings, so copying its slots is a
+        # full copy and skips deepcopy and the validators; fields added by
+        # subclasses are deep copied as before
+        cls = type(self)
+        new = cls.__new__(cls)
+        for name in Document.__slots__:
+            setattr(new, name, getattr(self, name))
+        if cls is not Document:
+            memo = {id(self): new}
+            for name in _slot_names(cls):
+                if name in Document.__slots__:
+                    continue
+                try:
+                    value = getattr(self, name)
+                except AttributeError:
+                    # Slot was never assigned
+                    continue
+                setattr(new, name, copy.deepcopy(value, memo))
+            if hasattr(self, '__dict__'):
+                new.__dict__.update(copy.deepcopy(self.__dict__, memo))
+        return new
     
     def __str__(self):
         return f"Title: {self.title}\nAuthor: {self.author}\nContent: {self.content}"
@@ -1,19 +1,24 @@
 from abc import ABC, abstractmethod
+import sys
 
-# Available user roles
-ACCESS_LEVELS = (
+# Available user roles. Rule strings are interned, so that checks with
+# interned roles and levels match on identity before comparing characters
+ACCESS_LEVELS = tuple(map(sys.intern, (
     "employee",
     "manager",
     "security",
     "admin"
-)
+)))
 
 # Access rules for documents by confidentiality level
 DOCUMENT_ACCESS_RULES = {
-    "general":        {"employee", "manager", "security", "admin"},
-    "internal-only":  {"manager", "security", "admin"},
-    "sensitive":      {"security", "admin"},
-    "classified":     {"admin"}
+    sys.intern(level): frozenset(map(sys.intern, roles))
+    for level, roles in (
+        ("general",       ("employee", "manager", "security", "admin")),
+        ("internal-only", ("manager", "security", "admin")),
+        ("sensitive",     ("security", "admin")),
+        ("classified",    ("admin",)),
+    )
 }
 
 
@@ -22,6 +27,8 @@ class User:
     Represents a user in the system with a role and a name.
     """
 
+    __slots__ = ('__name', '__role')
+
     def __init__(self, name: str, role: str):
         """
         Initialize a user with name and role.
@@ -32,11 +39,12 @@ class User:
         :raises ValueError: if values are invalid
         """
         self.name = name
-        if not isinstance(role, str):
-            raise TypeError("Parameter 'role' must be a string")
+        if __debug__:
+            if not isinstance(role, str):
+                raise TypeError("Parameter 'role' must be a string")
         if role not in ACCESS_LEVELS:
             raise ValueError(f"Invalid role: {role}")
-        self.__role = role
+        self.__role = sys.intern(role)
 
     @property
     def name(self) -> str:
@@ -46,8 +54,9 @@ class User:
     @name.setter
     def name(self, value: str):
         """Set and validate user's name"""
-        if not isinstance(value, str):
-            raise TypeError("Parameter 'name' must be a string")
+        if __debug__:
+            if not isinstance(value, str):
+                raise TypeError("Parameter 'name' must be a string")
         if not value.strip():
             raise ValueError("Parameter 'name' could not be empty")
         self.__name = value
@@ -66,6 +75,8 @@ class AbstractDocument(ABC):
     Abstract interface for any readable document.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def read(self) -> str:
         """
@@ -78,6 +89,8 @@ class Document(AbstractDocument):
     Real document that contains protected information.
     """
 
+    __slots__ = ('__name', '__content', '__level')
+
     def __init__(self, name: str, content: str, level: str):
         """
         Initialize document with name, content, and access level.
@@ -88,16 +101,18 @@ class Document(AbstractDocument):
         :raises TypeError: if arguments are not valid strings
         :raises ValueError: if level is not allowed
         """
-        if not all(isinstance(p, str) for p in (name, content, level)):
-            raise TypeError("Parameters 'name', 'content', and 'level' must be strings")
-        if not all(p.strip() for p in (name, content, level)):
+        if __debug__:
+            if (type(name) is not str or type(content) is not str
+                    or type(level) is not str):
+                raise TypeError("Parameters 'name', 'content', and 'level' must be strings")
+        if not (name.strip() and content.strip() and level.strip()):
             raise ValueError("Parameters 'name', 'content', and 'level' could not be empty")
         if level not in DOCUMENT_ACCESS_RULES:
             raise ValueError(f"Invalid document access level: {level}")
 
         self.__name = name
         self.__content = content
-        self.__level = level
+        self.__level = sys.intern(level)
 
     @property
     def level(self) -> str:
@@ -126,16 +141,20 @@ class DocumentProxy(AbstractDocument):
         :param role: User requesting access.
         :raises TypeError: if document or role are of wrong types
         """
-        if not isinstance(document, AbstractDocument):
-            raise TypeError(
-                "Parameter 'document' must be an instance of AbstractDocument"
-            )
-        if not isinstance(role, str):
-            raise TypeError("Parameter 'role' must be a string")
+        if __debug__:
+            if not isinstance(document, AbstractDocument):
+                raise TypeError(
+                    "Parameter 'document' must be an instance of AbstractDocument"
+                )
+            if not isinstance(role, str):
+                raise TypeError("Parameter 'role' must be a string")
         if role not in ACCESS_LEVELS:
             raise ValueError(f"Invalid role: {role}")
         self.__document = document
-        self.__role = role
+        self.__role = role = sys.intern(role)
+        # The document level and the role never change, so the access
+        # rule is resolved once instead of on every read
+        self.__granted = role in DOCUMENT_ACCESS_RULES[document.level]
 
     def read(self) -> str:
         """
@@ -144,19 +163,11 @@ class DocumentProxy(AbstractDocument):
         :return: Content if access is allowed
         :raises PermissionError: if access is denied
         """
-        if not self.__check_access():
+        if not self.__granted:
             raise PermissionError("Access denied.")
 
         return self.__document.read()
 
-    def __check_access(self) -> bool:
-        """
-        Check whether the user's role is in the list of allowed roles.
-
-        :return: True if access is granted, else False
-        """
-        return self.__role in DOCUMENT_ACCESS_RULES[self.__document.level]
-
 
 def main():
     """
@@ -1,3 +1,6 @@
+from itertools import count
+
+
 class IDGenerator:
     """
     Singleton class for generating sequential unique IDs.
@@ -8,29 +11,24 @@ class IDGenerator:
 
     # IDGenerator instance reference
     __instance = None
-    # Flag to ensure one-time initialization
-    __initialized = False
 
     def __new__(cls):
         """
         Creates or returns the single instance of IDGenerator.
 
+        The ID counter is initialized here, once, when the instance is
+        created, so repeated IDGenerator() calls do no extra work.
+
         :return: The singleton instance of IDGenerator.
         :rtype: IDGenerator
         """
         # Create instance if it doesn't exist yet
-        if not cls.__instance:
-            cls.__instance = super(IDGenerator, cls).__new__(cls)
+        if cls.__instance is None:
+            instance = super(IDGenerator, cls).__new__(cls)
+            # Yields IDs starting from 1; next() on it is atomic under the GIL
+            instance.__ids = count(1)
+            cls.__instance = instance
         return cls.__instance
-    
-    def __init__(self):
-        """
-        Initializes the ID counter only once during the first instantiation.
-        """
-        if not self.__initialized:
-            # Set start value for id
-            self.__id = 0
-            self.__initialized = True
 
     def get_next_id(self):
         """
@@ -39,14 +37,13 @@ class IDGenerator:
         :return: The next available ID.
         :rtype: int
         """
-        self.__id += 1
-        return self.__id
+        return next(self.__ids)
     
     def reset(self):
         """
         Resets the ID counter to zero.
         """
-        self.__id = 0
+        self.__ids = count(1)
 
 
 def main():
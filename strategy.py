@@ -1,7 +1,84 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import (AnyStr, Dict, Iterable, Iterator, List, Optional,
+                    Sequence, Tuple, Union)
+import fnmatch
+import mmap
 import os
 import pprint
+import re
+
+
+@lru_cache(maxsize=32)
+def _compile_query(query: AnyStr) -> re.Pattern:
+    """
+    Compile a case-insensitive matcher for a literal query.
+
+    :param query: Substring (text or bytes) to search for.
+    :return: Compiled regular expression.
+    """
+    return re.compile(re.escape(query), re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def _prep_query(query: str) -> Tuple[str, bytes]:
+    """
+    Lowercase a query once for every search that repeats it.
+
+    :param query: Search term.
+    :return: Lowercased query as text and as UTF-8 bytes.
+    """
+    lowered = query.lower()
+    return lowered, lowered.encode()
+
+
+@lru_cache(maxsize=32)
+def _compile_globs(patterns: Tuple[str, ...]) -> re.Pattern:
+    """
+    Compile glob patterns into one case-insensitive matcher.
+
+    :param patterns: Glob patterns matched against whole names.
+    :return: Compiled regular expression matching any of the patterns.
+    """
+    return re.compile(
+        '|'.join(fnmatch.translate(pattern) for pattern in patterns),
+        re.IGNORECASE
+    )
+
+
+# Characters that make an entry of a sequence name query a glob pattern
+_GLOB_CHARS = re.compile(r'[*?[]')
+
+def _validate_search_args(folder: str, queries: Sequence[str],
+                          check_dir: bool = True):
+    """
+    Validate a search folder and search terms in one call.
+
+    Cheap checks run first, so invalid input never costs a stat.
+
+    :param folder: Folder to search in.
+    :param queries: Search terms to validate.
+    :param check_dir: Whether to check that the folder exists.
+    :raises TypeError, ValueError: For invalid input.
+    """
+    if type(folder) is not str:
+        raise TypeError("Parameter 'folder' must be a string")
+    if not folder or folder.isspace():
+        raise ValueError("Parameter 'folder' must not be empty")
+    for query in queries:
+        if type(query) is not str:
+            raise TypeError("Parameter 'query' must be a string")
+        if not query or query.isspace():
+            raise ValueError("Parameter 'query' must not be empty")
+    if check_dir and not os.path.isdir(folder):
+        raise ValueError(f"Invalid folder path: {folder}")
+
+
+# Folder path -> (folder mtime when listed, [(name, is_file), ...])
+_LISTING_CACHE: Dict[str, Tuple[int, List[Tuple[str, bool]]]] = {}
 
 
 class SearchStrategy(ABC):
@@ -11,30 +88,68 @@ class SearchStrategy(ABC):
     for accessing directory content.
     """
 
-    def _get_folder_content(self, folder: str) -> Optional[List[str]]:
+    # Whether search() also takes a sequence of queries
+    _accepts_many: bool = False
+
+    def __init__(self, skip_hidden: bool = False):
+        """
+        Initialize the strategy.
+
+        :param skip_hidden: Leave out entries whose names start with a dot.
+        """
+        self._skip_hidden = bool(skip_hidden)
+
+    def _list_folder(self, folder: str) -> List[Tuple[str, bool]]:
         """
-        Safely retrieve the content of a given folder.
+        Safely retrieve the entries of a given folder.
+
+        The listing is cached until the folder's modification time
+        changes, so repeated searches skip scandir and per-entry stats.
+        Symlinks are not followed, so only regular files count as files.
 
         :param folder: Absolute or relative path to the directory.
-        :return: List of item names in the folder, or None if an error occurred.
+        :return: List of (name, is_file) pairs, empty if an error occurred.
         """
+        key = os.path.abspath(folder)
         try:
-            return os.listdir(folder)
-        except PermissionError:
-            print(f"Error: Permission denied to access '{folder}'.")
-            return
-        except Exception as e:
+            mtime = os.stat(key).st_mtime_ns
+            cached = _LISTING_CACHE.get(key)
+            if cached is not None and cached[0] == mtime:
+                return self._visible(cached[1])
+            # Unreadable folders are common enough to check up front
+            if not os.access(key, os.R_OK | os.X_OK):
+                print(f"Error: Permission denied to access '{folder}'.")
+                return []
+            with os.scandir(key) as entries:
+                # The file type comes from the directory read itself
+                listing = [(entry.name, entry.is_file(follow_symlinks=False))
+                           for entry in entries]
+        except OSError as e:
             print(f"An error occurred: {e}")
-            return
+            return []
+        _LISTING_CACHE[key] = (mtime, listing)
+        return self._visible(listing)
+
+    def _visible(self, listing: List[Tuple[str, bool]]
+                 ) -> List[Tuple[str, bool]]:
+        """
+        Filter out hidden entries if the strategy skips them.
+
+        :param listing: List of (name, is_file) pairs.
+        :return: The listing without dot-entries when skip_hidden is set.
+        """
+        if not self._skip_hidden:
+            return listing
+        return [item for item in listing if not item[0].startswith('.')]
 
     @abstractmethod
-    def search(self, folder: str, query: str) -> List[str]:
+    def search(self, folder: str, query: str) -> Iterator[str]:
         """
         Perform a search in the specified folder based on a query.
 
         :param folder: Folder to search in.
         :param query: Search term.
-        :return: List of matching file names.
+        :return: Iterator of matching file names.
         """
 
 
@@ -52,6 +167,10 @@ class FileSearcher:
         :param strategy: Initial search strategy.
         """
         self.strategy = strategy
+        # Folder set by bind() for search_in()
+        self.__folder: Optional[str] = None
+        # Absolute path of the last folder that passed validation
+        self.__checked_folder: Optional[str] = None
 
     @property
     def strategy(self) -> SearchStrategy:
@@ -74,25 +193,98 @@ class FileSearcher:
             )
         self.__strategy = strategy
 
-    def search(self, folder: str, query: str) -> List[str]:
+    @staticmethod
+    def invalidate_cache(folder: Optional[str] = None):
+        """
+        Forget cached folder listings.
+
+        :param folder: Folder to forget, or None to clear every listing.
+        """
+        if folder is None:
+            _LISTING_CACHE.clear()
+        else:
+            _LISTING_CACHE.pop(os.path.abspath(folder), None)
+
+    def bind(self, folder: str):
+        """
+        Validate a folder once and use it for later search_in() calls.
+
+        :param folder: Folder to search in.
+        :raises TypeError, ValueError: For an invalid folder.
+        """
+        _validate_search_args(folder, ())
+        self.__folder = os.path.abspath(folder)
+
+    def search_in(self, query: Union[str, Sequence[str]],
+                  max_results: Optional[int] = None) -> Iterator[str]:
+        """
+        Perform a search in the folder set by bind().
+
+        :param query: Search term, or a sequence of terms if the strategy
+            accepts several.
+        :param max_results: Stop after this many matches (no limit if None).
+        :return: Iterator of matching file names.
+        :raises RuntimeError: If no folder is bound.
+        :raises TypeError, ValueError: For invalid input.
+        """
+        if self.__folder is None:
+            raise RuntimeError("No folder is bound to the FileSearcher")
+        return self._run(self.__folder, query, max_results, False)
+
+    def search(self, folder: str, query: Union[str, Sequence[str]],
+               max_results: Optional[int] = None) -> Iterator[str]:
         """
         Perform a search using the current strategy.
 
+        Matches are produced lazily, so the folder is only scanned
+        as far as the caller consumes the results.
+
         :param folder: Folder to search in.
-        :param query: Search term.
-        :return: List of matching file names.
+        :param query: Search term, or a sequence of terms if the strategy
+            accepts several.
+        :param max_results: Stop after this many matches (no limit if None).
+        :return: Iterator of matching file names.
         :raises TypeError, ValueError: For invalid input.
         """
-        if not isinstance(folder, str):
-            raise TypeError("Parameter 'folder' must be a string")
-        if not folder.strip():
-            raise ValueError("Parameter 'folder' must not be empty")
-        if not os.path.isdir(folder):
-            raise ValueError(f"Invalid folder path: {folder}")
-        if not isinstance(query, str):
-            raise TypeError("Parameter 'query' must be a string")
-        if not query.strip():
-            raise ValueError("Parameter 'query' must not be empty")
+        # Back-to-back searches in one folder skip the isdir syscall;
+        # absolute paths keep relative ones apart across chdir()
+        checked = (type(folder) is str and
+                   os.path.abspath(folder) == self.__checked_folder)
+        return self._run(folder, query, max_results, not checked)
+
+    def _run(self, folder: str, query: Union[str, Sequence[str]],
+             max_results: Optional[int], check_dir: bool) -> Iterator[str]:
+        """
+        Validate the arguments and delegate the search to the strategy.
+
+        :param folder: Folder to search in.
+        :param query: Search term, or a sequence of terms if the strategy
+            accepts several.
+        :param max_results: Stop after this many matches (no limit if None).
+        :param check_dir: Whether to check that the folder exists.
+        :return: Iterator of matching file names.
+        :raises TypeError, ValueError: For invalid input.
+        """
+        if isinstance(query, (list, tuple)):
+            if not self.strategy._accepts_many:
+                raise TypeError(
+                    f"{type(self.strategy).__name__} doesn't accept "
+                    "several queries"
+                )
+            if not query:
+                raise ValueError("Parameter 'query' must not be empty")
+            query = tuple(query)
+            _validate_search_args(folder, query, check_dir)
+        else:
+            _validate_search_args(folder, (query,), check_dir)
+        if check_dir:
+            self.__checked_folder = os.path.abspath(folder)
+        if max_results is not None:
+            if not isinstance(max_results, int):
+                raise TypeError("Parameter 'max_results' must be an integer")
+            if max_results < 1:
+                raise ValueError("Parameter 'max_results' must be positive")
+            return islice(self.strategy.search(folder, query), max_results)
         return self.strategy.search(folder, query)
 
 
@@ -102,27 +294,42 @@ class NameSearchStrategy(SearchStrategy):
     that contain a query in their name.
     """
 
-    def search(self, folder: str, query: str) -> List[str]:
+    _accepts_many = True
+
+    def search(self, folder: str,
+               query: Union[str, Sequence[str]]) -> Iterator[str]:
         """
         Search for files with names that contain the query substring.
 
+        A single query is always a plain substring. A sequence of queries
+        matches names that satisfy any of them; entries with glob wildcards
+        are matched as glob patterns against whole names, the others as
+        substrings.
+
         :param folder: Folder to search in.
-        :param query: Substring to search for in filenames.
-        :return: List of matching filenames.
-        """
-        query = query.lower()
-        content = self._get_folder_content(folder)
-        result = []
-        if content:
-            for item in content:
+        :param query: Substring, or sequence of substrings and glob patterns.
+        :return: Iterator of matching filenames.
+        """
+        if isinstance(query, str):
+            globs = ()
+            # Plain substrings are cheaper to test with 'in'
+            subs = (_prep_query(query)[0],)
+        else:
+            globs = tuple(q for q in query if _GLOB_CHARS.search(q))
+            subs = tuple(_prep_query(q)[0] for q in query
+                         if not _GLOB_CHARS.search(q))
+        # All glob patterns are tested in a single regex pass
+        match = _compile_globs(globs).match if globs else None
+        for item, is_file in self._list_folder(folder):
+            if match is not None and match(item):
+                yield item
+                continue
+            if subs:
                 name = item
-                full_path = os.path.join(folder, item)
-                if os.path.isfile(full_path):
+                if is_file:
                     name = os.path.splitext(item)[0].lower()
-                if query in name:
-                    result.append(item)
-
-        return result
+                if any(sub in name for sub in subs):
+                    yield item
 
 
 class ExtensionSearchStrategy(SearchStrategy):
@@ -131,27 +338,22 @@ class ExtensionSearchStrategy(SearchStrategy):
     by their extension.
     """
 
-    def search(self, folder: str, query: str) -> List[str]:
+    def search(self, folder: str, query: str) -> Iterator[str]:
         """
         Search for files with a specific extension.
 
         :param folder: Folder to search in.
         :param query: File extension to search for (without dot).
-        :return: List of matching filenames.
+        :return: Iterator of matching filenames.
         """
-        query = query.lower()
-        content = self._get_folder_content(folder)
-        result = []
-        if content:
-            for item in content:
-                full_path = os.path.join(folder, item)
-                if not os.path.isfile(full_path):
-                    continue
-                ext = os.path.splitext(item)[1][1:].lower()
-                if query == ext:
-                    result.append(item)
-
-        return result
+        query = _prep_query(query)[0]
+        for item, is_file in self._list_folder(folder):
+            if not is_file:
+                continue
+            head, sep, ext = item.rpartition('.')
+            # Like splitext, leading dots don't start an extension
+            if sep and ext.lower() == query and head.lstrip('.'):
+                yield item
 
 
 class ContentSearchStrategy(SearchStrategy):
@@ -160,32 +362,197 @@ class ContentSearchStrategy(SearchStrategy):
     that contain a query in their content.
     """
 
-    def search(self, folder: str, query: str) -> List[str]:
+    # Buffer size of opened files
+    _read_buffer: int = 1 << 17
+    # Files at least this large are memory-mapped instead of read
+    _mmap_threshold: int = 1 << 16
+    # Leading bytes checked for NUL to skip binary files
+    _sniff_size: int = 4096
+    # Threads grepping files concurrently
+    _max_workers: Optional[int] = os.cpu_count()
+    # Files handed to the threads at a time
+    _batch_size: int = 256
+
+    def __init__(self, skip_hidden: bool = False,
+                 max_file_size: Optional[int] = None):
+        """
+        Initialize the strategy.
+
+        :param skip_hidden: Leave out entries whose names start with a dot.
+        :param max_file_size: Skip files larger than this many bytes
+            (no limit if None).
+        :raises TypeError, ValueError: For an invalid max_file_size.
+        """
+        super().__init__(skip_hidden)
+        if max_file_size is not None:
+            if not isinstance(max_file_size, int):
+                raise TypeError("Parameter 'max_file_size' must be an integer")
+            if max_file_size < 1:
+                raise ValueError("Parameter 'max_file_size' must be positive")
+        self._max_file_size = max_file_size
+
+    def _too_large(self, size: int) -> bool:
+        """
+        Check a file size against max_file_size.
+
+        :param size: File size in bytes.
+        :return: True if the file should be skipped.
+        """
+        return self._max_file_size is not None and size > self._max_file_size
+
+    def search(self, folder: str, query: str) -> Iterator[str]:
         """
         Search for files containing the query string in their content.
 
         :param folder: Folder to search in.
         :param query: Substring to search for inside files.
-        :return: List of matching filenames.
-        """
-        query = query.lower()
-        content = self._get_folder_content(folder)
-        result = []
-        if content:
-            for item in content:
-                full_path = os.path.join(folder, item)
-                if not os.path.isfile(full_path):
-                    continue
-                try:
-                    with open(full_path, 'r') as fhand:
-                        for line in fhand:
-                            if query in line.lower():
-                                result.append(item)
-                                break
-                except:
-                    continue
-
-        return result
+        :return: Iterator of matching filenames.
+        """
+        needle = _prep_query(query)[1]
+        # bytes.lower() only folds ASCII, other queries need the pattern
+        contains = (self._bytes_contain if needle.isascii()
+                    else self._lines_contain)
+
+        def grep_one(path: str) -> bool:
+            try:
+                return contains(path, query, needle)
+            except (OSError, UnicodeDecodeError):
+                # Unreadable, vanished or non-text files don't match
+                return False
+
+        files = self._files(folder)
+        # Only the file I/O releases the GIL; matching holds it, so threads
+        # overlap waiting on the disk, not the searching itself
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        try:
+            # Batches keep results flowing while files are still found
+            while batch := list(islice(files, self._batch_size)):
+                hits = executor.map(grep_one, [path for _, path in batch])
+                for (item, _), found in zip(batch, hits):
+                    if found:
+                        yield item
+        finally:
+            # Drop pending files if the caller stops early
+            executor.shutdown(cancel_futures=True)
+
+    def _files(self, folder: str) -> Iterator[Tuple[str, str]]:
+        """
+        List the files to search.
+
+        :param folder: Folder to search in.
+        :return: Iterator of (reported name, path) pairs.
+        """
+        for item, is_file in self._list_folder(folder):
+            if is_file:
+                yield item, os.path.join(folder, item)
+
+    def _bytes_contain(self, path: str, query: str, needle: bytes) -> bool:
+        """
+        Search a file's bytes for a lowercase ASCII needle.
+
+        Small files are read whole, large files are memory-mapped
+        and searched in place.
+
+        :param path: Path to the file.
+        :param query: Original search term.
+        :param needle: Lowercased, encoded search term.
+        :return: True if the file contains the needle.
+        """
+        # Needles without letters match the raw bytes as they are
+        fold = needle.upper() != needle
+        with open(path, 'rb', buffering=self._read_buffer) as fhand:
+            size = os.fstat(fhand.fileno()).st_size
+            if not size or self._too_large(size):
+                return False
+            head = fhand.read(self._sniff_size)
+            if b'\0' in head:
+                return False
+            if size >= self._mmap_threshold:
+                with mmap.mmap(fhand.fileno(), 0,
+                               access=mmap.ACCESS_READ) as mm:
+                    if fold:
+                        # A bytes pattern folds ASCII case without copying
+                        return _compile_query(needle).search(mm) is not None
+                    return mm.find(needle) != -1
+            data = head + fhand.read()
+        # bytes.lower() is a plain table lookup per byte
+        if fold:
+            data = data.lower()
+        return needle in data
+
+    def _lines_contain(self, path: str, query: str, needle: bytes) -> bool:
+        """
+        Scan a text file line by line with a case-insensitive pattern.
+
+        :param path: Path to the file.
+        :param query: Original search term.
+        :param needle: Lowercased, encoded search term.
+        :return: True if any line contains the query.
+        """
+        search = _compile_query(query).search
+        with open(path, 'r', buffering=self._read_buffer) as fhand:
+            if self._too_large(os.fstat(fhand.fileno()).st_size):
+                return False
+            for line in fhand:
+                if search(line):
+                    return True
+        return False
+
+
+class RecursiveContentSearchStrategy(ContentSearchStrategy):
+    """
+    Concrete search strategy for finding files in a folder
+    and its subfolders that contain a query in their content.
+    """
+
+    # Folders that are pruned unless skip_dirs says otherwise
+    _default_skip_dirs = frozenset({'.git', 'node_modules', '__pycache__'})
+
+    def __init__(self, skip_hidden: bool = False,
+                 max_file_size: Optional[int] = None,
+                 skip_dirs: Optional[Iterable[str]] = None):
+        """
+        Initialize the strategy.
+
+        :param skip_hidden: Leave out entries whose names start with a dot.
+        :param max_file_size: Skip files larger than this many bytes
+            (no limit if None).
+        :param skip_dirs: Folder names whose subtrees are not searched
+            (.git, node_modules and __pycache__ if None).
+        :raises TypeError, ValueError: For an invalid max_file_size.
+        """
+        super().__init__(skip_hidden, max_file_size)
+        self._skip_dirs = (self._default_skip_dirs if skip_dirs is None
+                           else frozenset(skip_dirs))
+
+    def _files(self, folder: str) -> Iterator[Tuple[str, str]]:
+        """
+        Walk the folder tree depth-first with os.scandir.
+
+        Symlinked folders are not entered, so the walk can't loop.
+
+        :param folder: Root folder to search in.
+        :return: Iterator of (path relative to the root, path) pairs.
+        """
+        pending = deque([(folder, '')])
+        while pending:
+            path, relative = pending.pop()
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if self._skip_hidden and name.startswith('.'):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            # Pruned subtrees are never listed
+                            if name not in self._skip_dirs:
+                                pending.append(
+                                    (entry.path, os.path.join(relative, name))
+                                )
+                        elif entry.is_file(follow_symlinks=False):
+                            yield os.path.join(relative, name), entry.path
+            except OSError as e:
+                print(f"An error occurred: {e}")
 
 
 def main():
@@ -198,7 +565,7 @@ def main():
     text = "import os"
 
     searcher = FileSearcher(NameSearchStrategy())
-    results = searcher.search(directory, name)
+    results = list(searcher.search(directory, name))
     if results:
         print(f"All items with '{name}' in name:")
         pprint.pp(results)
@@ -206,7 +573,7 @@ def main():
         print(f"There are no items with '{name}' in name")
 
     searcher.strategy = ExtensionSearchStrategy()
-    results = searcher.search(directory, extension)
+    results = list(searcher.search(directory, extension))
     if results:
         print(f"\nAll files with extension '.{extension}':")
         pprint.pp(results)
@@ -214,7 +581,7 @@ def main():
         print(f"\nThere are no files with extension '.{extension}'")
 
     searcher.strategy = ContentSearchStrategy()
-    results = searcher.search(directory, text)
+    results = list(searcher.search(directory, text))
     if results:
         print(f"\nAll files that contain '{text}':")
         pprint.pp(results)
@@ -1,6 +1,14 @@
 from abc import ABC, abstractmethod
 from typing import List, Any, Optional
 from io import TextIOWrapper
+import csv
+
+
+# Translation tables escaping markup characters in cell values
+_HTML_ESCAPES = str.maketrans({
+    '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'
+})
+_XML_ESCAPES = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
 
 
 class TableWriter(ABC):
@@ -11,6 +19,9 @@ class TableWriter(ABC):
     including validating input and writing header, content, and footer.
     """
 
+    # Write buffer for output files, so large tables need few syscalls
+    _buffer_size: int = 1 << 20
+
     def __init__(self):
         self.__fhand = None
         self.__data = None
@@ -42,7 +53,8 @@ class TableWriter(ABC):
         self._validate_filename(filename)
         self._validate_data(data)
         try:
-            with open(filename, 'w') as fhand:
+            with open(filename, 'w', buffering=self._buffer_size,
+                      newline='\n') as fhand:
                 self.__fhand = fhand
                 self.__data = data
                 self._write_header()
@@ -98,22 +110,22 @@ class TableWriter(ABC):
         if not data:
             raise ValueError("Parameter 'data' must not be empty")
 
-        length_set = set()
+        header = data[0]
+        # Compare every row with the header in one pass
         for item in data:
             if not isinstance(item, list):
                 raise TypeError("Parameter 'data' must be list of lists")
             if not item:
                 raise ValueError("Lists in data must not be empty")
-            length_set.add(len(item))
-
-        if len(length_set) != 1:
-            raise ValueError("All lists in 'data' must have equal lengths")
-
-        for el in data[0]:
-            if not isinstance(el, str):
-                raise TypeError(
-                    "All elements in first sublist in 'data' must be strings"
-                )
+            if item is header:
+                for el in item:
+                    if not isinstance(el, str):
+                        raise TypeError(
+                            "All elements in first sublist in 'data' "
+                            "must be strings"
+                        )
+            elif len(item) != len(header):
+                raise ValueError("All lists in 'data' must have equal lengths")
 
     def _write_header(self):
         """
@@ -160,17 +172,18 @@ class HTMLTableWriter(TableWriter):
         """
         Writes the table content with headers in <th> and rows in <td>.
         """
-        self.fhand.write("<thead>\n<tr>\n")
-        for col in self.data[0]:
-            self.fhand.write(f"<th>{col}</th>\n")
-        self.fhand.write("</tr>\n</thead>\n")
-        self.fhand.write("<tbody>\n")
+        # Build the whole body first and write it with a single call
+        parts = ["<thead>\n<tr>\n"]
+        parts.extend(f"<th>{str(col).translate(_HTML_ESCAPES)}</th>\n"
+                     for col in self.data[0])
+        parts.append("</tr>\n</thead>\n<tbody>\n")
         for row in self.data[1:]:
-            self.fhand.write("<tr>\n")
-            for col in row:
-                self.fhand.write(f"<td>{col}</td>\n")
-            self.fhand.write("</tr>\n")
-        self.fhand.write("</tbody>\n")
+            parts.append("<tr>\n")
+            parts.extend(f"<td>{str(col).translate(_HTML_ESCAPES)}</td>\n"
+                         for col in row)
+            parts.append("</tr>\n")
+        parts.append("</tbody>\n")
+        self.fhand.write("".join(parts))
 
     def _write_footer(self):
         """
@@ -200,15 +213,22 @@ class XMLTableWriter(TableWriter):
     def _write_content(self):
         """
         Writes each row as an XML <row> element with child elements for columns.
+
+        Values are escaped, column names are used as element names as is.
         """
-        col_count = len(self.data[0])
+        # Column tags are the same for every row, format them once
+        open_tags = [f"<{tag}>" for tag in self.data[0]]
+        close_tags = [f"</{tag}>\n" for tag in self.data[0]]
+        parts = []
+        append = parts.append
         for row in self.data[1:]:
-            self.fhand.write("<row>\n")
-            for i in range(col_count):
-                self.fhand.write(
-                    f"<{self.data[0][i]}>{row[i]}</{self.data[0][i]}>\n"
-                )
-            self.fhand.write("</row>\n")
+            append("<row>\n")
+            for open_tag, value, close_tag in zip(open_tags, row, close_tags):
+                append(open_tag)
+                append(str(value).translate(_XML_ESCAPES))
+                append(close_tag)
+            append("</row>\n")
+        self.fhand.write("".join(parts))
 
     def _write_footer(self):
         """
@@ -232,9 +252,12 @@ class CSVTableWriter(TableWriter):
     def _write_content(self):
         """
         Writes each row as a comma-separated line.
+
+        Cells containing commas, quotes or line breaks are quoted.
         """
-        for row in self.data:
-            self.fhand.write(f"{','.join(map(str, row))}\n")
+        writer = csv.writer(self.fhand, lineterminator="\n")
+        # Convert cells like the other writers, so None is written as 'None'
+        writer.writerows(map(str, row) for row in self.data)
 
 
 def main():
@@ -1,57 +1,164 @@
-from abc import ABC, abstractmethod
-from typing import Any
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Iterable, List, Sequence
+import math
+import sys
+
+try:
+    import numpy as np
+except ImportError:
+    # numpy is optional, only bulk_discount() needs it
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # numba is optional, bulk pricing falls back to plain NumPy
+    njit = None
 
 PRECISION = 2
+# Exact numeric types accepted without an isinstance() call
+_NUMERIC = (int, float)
+# Prices are stored as integer counts of 1 / _SCALE (cents)
+_SCALE = 10 ** PRECISION
 
-class SimpleTextField:
+
+def _discounted(cents: int, discount: int) -> float:
     """
-    Descriptor class for validating non-empty string fields.
-    Ensures the value is a non-empty string.
+    Apply a percent discount to a price in cents.
 
-    :raises TypeError: If value is not a string.
-    :raises ValueError: If value is an empty string.
+    :param cents: Price in cents.
+    :param discount: Discount in percent.
+    :return: Discounted price, rounded half up to cents.
     """
+    return (cents * (100 - discount) + 50) // 100 / _SCALE
+
+
+if njit is None:
+    # The scalar formula works element-wise on arrays as well
+    _apply_discounts = _discounted
+else:
+    # Compiled once and cached on disk, later runs skip the JIT
+    @njit(cache=True, parallel=True)
+    def _apply_discounts(cents: np.ndarray, discount: np.ndarray
+                         ) -> np.ndarray:
+        """
+        Apply percent discounts to arrays of prices in cents.
+
+        :param cents: Prices in cents.
+        :param discount: Discounts in percent.
+        :return: Discounted prices, rounded half up to cents.
+        """
+        out = np.empty(cents.size, dtype=np.float64)
+        for i in prange(cents.size):
+            out[i] = (cents[i] * (100 - discount[i]) + 50) // 100 / _SCALE
+        return out
 
-    def __set_name__(self, owner, name):
-        self.name = name
-        self.attr_name = '__' + self.name.lstrip('_')
 
-    def __get__(self, instance, owner):
-        return getattr(instance, self.attr_name, None)
+def _check_str(value: str, field: str) -> str:
+    """
+    Validate a non-empty string field.
 
-    def __set__(self, instance, value):
-        if not isinstance(value, str):
-            raise TypeError(f"'{self.name}' must be an instance of string.")
-        if not value.strip():
-            raise ValueError(f"'{self.name}' must not be empty.")
-        setattr(instance, self.attr_name, value)
+    :param value: Value to check.
+    :param field: Field name used in error messages.
+    :return: The same value.
+    :raises TypeError: If value is not a string.
+    :raises ValueError: If value is an empty string.
+    """
+    if not isinstance(value, str):
+        raise TypeError(f"'{field}' must be an instance of string.")
+    if not value or value.isspace():
+        raise ValueError(f"'{field}' must not be empty.")
+    return value
 
 
-class Product(ABC):
+class Product:
     """
-    Abstract base class representing a product.
+    Base class representing a product.
 
     :param price: Product price.
     :param name: Product name.
     :param producer: Product producer or manufacturer.
     """
 
-    name = SimpleTextField()
-    producer = SimpleTextField()
+    __slots__ = ('__name', '__producer', '__producer_lc', '__price_cents',
+                 '_descr')
+
+    # Index of the matching visit method in Visitor's dispatch table
+    KIND: int
+    # Product type shown at the start of the description
+    _LABEL = "Product"
 
     def __init__(self, price: float, name: str, producer: str):
         self.price = price
-        self.name = name
+        self.__name = _check_str(name, 'name')
         self.producer = producer
 
     @property
-    def price(self) -> str:
+    def name(self) -> str:
+        """
+        Get the product name.
+
+        :return: Product name.
+        """
+        return self.__name
+
+    @name.setter
+    def name(self, name: str):
+        """
+        Set and validate the product name.
+
+        :param name: Name to set.
+        :raises TypeError: If name is not a string.
+        :raises ValueError: If name is an empty string.
+        """
+        self.__name = _check_str(name, 'name')
+        self.__describe()
+
+    @property
+    def producer(self) -> str:
+        """
+        Get the product producer.
+
+        :return: Product producer.
+        """
+        return self.__producer
+
+    @producer.setter
+    def producer(self, producer: str):
+        """
+        Set and validate the product producer.
+
+        :param producer: Producer to set.
+        :raises TypeError: If producer is not a string.
+        :raises ValueError: If producer is an empty string.
+        """
+        self.__producer = _check_str(producer, 'producer')
+        # Lowercased and interned once for case-insensitive lookups
+        self.__producer_lc = sys.intern(producer.lower())
+        self.__describe()
+
+    def __describe(self):
+        # The description is rebuilt only when name or producer change
+        self._descr = f"{self._LABEL} '{self.__name}' by '{self.__producer}'"
+
+    @property
+    def price(self) -> float:
         """
         Get the product price.
 
         :return: Product price.
         """
-        return self.__price
+        return self.__price_cents / _SCALE
+
+    @property
+    def price_cents(self) -> int:
+        """
+        Get the product price in cents.
+
+        :return: Product price as an integer number of cents.
+        """
+        return self.__price_cents
 
     @price.setter
     def price(self, price: float):
@@ -60,22 +167,27 @@ class Product(ABC):
 
         :param price: Price to set.
         :raises TypeError: If price is not numeric.
-        :raises ValueError: If price is not positive.
+        :raises ValueError: If price is not positive or not finite.
         """
-        if not isinstance(price, (int, float)):
+        # Exact types skip isinstance, subclasses still pass through it
+        if type(price) not in _NUMERIC and not isinstance(price, _NUMERIC):
             raise TypeError("Parameter 'price' must be an instance of float")
         if price <= 0:
             raise ValueError("Parameter 'price' must be positive number")
-        self.__price = round(float(price), PRECISION)
+        # Comparing with inf also rejects NaN, for which every test is False
+        if not price < math.inf:
+            raise ValueError("Parameter 'price' must be a finite number")
+        # Price is positive, so truncating after +0.5 rounds half up
+        self.__price_cents = int(price * _SCALE + 0.5)
 
-    @abstractmethod
-    def accept(self, v: "Visitor") -> Any:
+    @property
+    def producer_lc(self) -> str:
         """
-        Accept a visitor.
+        Get the producer name in lowercase.
 
-        :param v: Visitor object.
+        :return: Lowercased producer.
         """
-        pass
+        return self.__producer_lc
 
     def __str__(self) -> str:
         """
@@ -83,7 +195,7 @@ class Product(ABC):
 
         :return: Product description.
         """
-        return f"'{self.name}' by '{self.producer}'"
+        return self._descr
 
 
 class Book(Product):
@@ -93,18 +205,38 @@ class Book(Product):
     :param author: Author of the book.
     """
 
-    author = SimpleTextField()
+    KIND = 0
+    _LABEL = "Book"
+
+    __slots__ = ('__author',)
 
     def __init__(self, price: float, name: str, producer: str, author: str):
         super().__init__(price, name, producer)
         self.author = author
 
+    @property
+    def author(self) -> str:
+        """
+        Get the author of the book.
+
+        :return: Book author.
+        """
+        return self.__author
+
+    @author.setter
+    def author(self, author: str):
+        """
+        Set and validate the author.
+
+        :param author: Author to set.
+        :raises TypeError: If author is not a string.
+        :raises ValueError: If author is an empty string.
+        """
+        self.__author = _check_str(author, 'author')
+
     def accept(self, v: "Visitor") -> Any:
         return v.visit_book(self)
 
-    def __str__(self) -> str:
-        return f"Book {super().__str__()}"
-
 
 class PhoneStand(Product):
     """
@@ -113,18 +245,38 @@ class PhoneStand(Product):
     :param material: Material of the stand.
     """
 
-    material = SimpleTextField()
+    KIND = 1
+    _LABEL = "Phone Stand"
+
+    __slots__ = ('__material',)
 
     def __init__(self, price: float, name: str, producer: str, material: str):
         super().__init__(price, name, producer)
         self.material = material
 
+    @property
+    def material(self) -> str:
+        """
+        Get the material of the stand.
+
+        :return: Stand material.
+        """
+        return self.__material
+
+    @material.setter
+    def material(self, material: str):
+        """
+        Set and validate the material.
+
+        :param material: Material to set.
+        :raises TypeError: If material is not a string.
+        :raises ValueError: If material is an empty string.
+        """
+        self.__material = _check_str(material, 'material')
+
     def accept(self, v: "Visitor") -> Any:
         return v.visit_phone_stand(self)
 
-    def __str__(self) -> str:
-        return f"Phone Stand {super().__str__()}"
-
 
 class USBFlashDrive(Product):
     """
@@ -133,6 +285,11 @@ class USBFlashDrive(Product):
     :param capacity_gb: Storage capacity in GB.
     """
 
+    KIND = 2
+    _LABEL = "USB Flash Drive"
+
+    __slots__ = ('__capacity_gb',)
+
     def __init__(self, price: float, name: str, producer: str, capacity_gb: int):
         super().__init__(price, name, producer)
         self.capacity_gb = capacity_gb
@@ -155,7 +312,7 @@ class USBFlashDrive(Product):
         :raises TypeError: If capacity_gb not an integer.
         :raises ValueError: If capacity_gb not a positive number.
         """
-        if not isinstance(capacity_gb, int):
+        if type(capacity_gb) is not int and not isinstance(capacity_gb, int):
             raise TypeError(
                 "Parameter 'capacity_gb' must be an instance of int"
             )
@@ -168,27 +325,70 @@ class USBFlashDrive(Product):
     def accept(self, v: "Visitor") -> Any:
         return v.visit_usb_flash_drive(self)
 
-    def __str__(self) -> str:
-        return f"USB Flash Drive {super().__str__()}"
+
+# (Product.KIND, lowercased producer) -> extra discount, in percent.
+# Producers are interned to match the interned Product.producer_lc.
+PRODUCER_BONUS = {
+    (kind, sys.intern(producer)): bonus
+    for (kind, producer), bonus in {
+        (Book.KIND, "pengein"): 5,
+        (Book.KIND, "o'relly"): 10,
+        (PhoneStand.KIND, "baseus"): 5,
+        (PhoneStand.KIND, "ugreen"): 3,
+        (USBFlashDrive.KIND, "sandisk"): 5,
+        (USBFlashDrive.KIND, "kingston"): 5,
+    }.items()
+}
 
 
-class Visitor(ABC):
+class Visitor:
     """
-    Abstract visitor interface with visit methods
+    Base visitor interface with visit methods
     for all product types.
+
+    A plain class rather than an ABC, so creating visitors
+    skips the ABCMeta instantiation checks.
     """
 
-    @abstractmethod
+    __slots__ = ('_table',)
+
+    def __init__(self):
+        # Visit methods ordered by Product.KIND, bound once per visitor
+        # so that overrides in subclasses are picked up
+        self._table = (
+            self.visit_book,
+            self.visit_phone_stand,
+            self.visit_usb_flash_drive,
+        )
+
+    def dispatch(self, product: Product) -> Any:
+        """
+        Visit a product by its KIND tag instead of calling accept().
+
+        :param product: Product to visit.
+        :return: Result of the matching visit method.
+        """
+        return self._table[product.KIND](product)
+
+    def dispatch_all(self, products: Iterable[Product]) -> List[Any]:
+        """
+        Visit several products, indexing the visit method table inline
+        so each product costs one call instead of two.
+
+        :param products: Products to visit.
+        :return: Results of the matching visit methods, in order.
+        """
+        table = self._table
+        return [table[product.KIND](product) for product in products]
+
     def visit_book(self, book: Book) -> Any:
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def visit_phone_stand(self, stand: PhoneStand) -> Any:
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def visit_usb_flash_drive(self, drive: USBFlashDrive) -> Any:
-        pass
+        raise NotImplementedError
 
 
 class DiscountVisitor(Visitor):
@@ -197,6 +397,16 @@ class DiscountVisitor(Visitor):
     based on rules.
     """
 
+    __slots__ = ()
+
+    # Rules per Product.KIND: (base discount in percent, price in cents
+    # a PRODUCER_BONUS requires exceeding, or None)
+    _RULES = (
+        (10, None),
+        (5, None),
+        (0, 30 * _SCALE),
+    )
+
     def visit_book(self, book: Book) -> float:
         """
         Apply discount rules to books.
@@ -204,12 +414,7 @@ class DiscountVisitor(Visitor):
         :param book: Book instance.
         :return: Discounted price.
         """
-        discount = 10
-        if book.producer.lower() == "pengein":
-            discount += 5
-        elif book.producer.lower() == "o'relly":
-            discount += 10
-        return round(book.price * ((100 - discount) / 100), PRECISION)
+        return _discount(Book.KIND, book.producer_lc, book.price_cents)
 
     def visit_phone_stand(self, stand: PhoneStand) -> float:
         """
@@ -218,12 +423,8 @@ class DiscountVisitor(Visitor):
         :param stand: PhoneStand instance.
         :return: Discounted price.
         """
-        discount = 5
-        if stand.producer.lower() == "baseus":
-            discount += 5
-        elif stand.producer.lower() == "ugreen":
-            discount += 3
-        return round(stand.price * ((100 - discount) / 100), PRECISION)
+        return _discount(PhoneStand.KIND, stand.producer_lc,
+                         stand.price_cents)
 
     def visit_usb_flash_drive(self, drive: USBFlashDrive) -> float:
         """
@@ -232,11 +433,57 @@ class DiscountVisitor(Visitor):
         :param drive: USBFlashDrive instance.
         :return: Discounted price.
         """
-        discount = 0
-        if (drive.price > 30 and
-            drive.producer.lower() in ("sandisk", "kingston")):
-            discount += 5
-        return round(drive.price * ((100 - discount) / 100), PRECISION)
+        return _discount(USBFlashDrive.KIND, drive.producer_lc,
+                         drive.price_cents)
+
+
+# Discounts depend only on these three values, so repeated
+# products in a catalog are priced once
+@lru_cache(maxsize=4096)
+def _discount(kind: int, producer_lc: str, price_cents: int) -> float:
+    """
+    Apply the DiscountVisitor rules for a product kind.
+
+    :param kind: Product.KIND of the product.
+    :param producer_lc: Lowercased producer.
+    :param price_cents: Price in cents.
+    :return: Discounted price.
+    """
+    base, bonus_from = DiscountVisitor._RULES[kind]
+    if bonus_from is None or price_cents > bonus_from:
+        base += PRODUCER_BONUS.get((kind, producer_lc), 0)
+    return _discounted(price_cents, base)
+
+
+def bulk_discount(products: Sequence[Product]) -> "np.ndarray":
+    """
+    Apply the DiscountVisitor rules to a whole catalog at once.
+
+    The rules run as masked array operations instead of one visit
+    per product, which pays off for large catalogs.
+
+    :param products: Products to price.
+    :return: Discounted prices, in the order of products.
+    :raises ImportError: If numpy is not installed.
+    """
+    if np is None:
+        raise ImportError("bulk_discount() requires numpy")
+    count = len(products)
+    cents = np.fromiter((p.price_cents for p in products),
+                        dtype=np.int64, count=count)
+    kinds = np.fromiter((p.KIND for p in products),
+                        dtype=np.int8, count=count)
+    producers = np.array([p.producer_lc for p in products], dtype=str)
+
+    rules = DiscountVisitor._RULES
+    discount = np.array([base for base, _ in rules], dtype=np.int64)[kinds]
+    for (kind, producer), bonus in PRODUCER_BONUS.items():
+        mask = (kinds == kind) & (producers == producer)
+        bonus_from = rules[kind][1]
+        if bonus_from is not None:
+            mask &= cents > bonus_from
+        discount[mask] += bonus
+    return _apply_discounts(cents, discount)
 
 
 def main():
@@ -303,9 +550,13 @@ def main():
     print(f"{' Discounted Prices ':=^88}")
     print(f"| {'Name':^45} | {'Price, USD':^12} "
           f"| {'Discounted Price, USD':^21} |")
-    for product in products:
-        print(f"| {str(product):<45} | {product.price:>12.2f} "
-              f"| {product.accept(visitor):>21.2f} |")
+    # Columns are computed in one pass each over the products
+    descriptions = map(str, products)
+    prices = map(attrgetter("price"), products)
+    discounts = visitor.dispatch_all(products)
+    # Bound once, the row template is applied by map as well
+    row_format = "| {:<45} | {:>12.2f} | {:>21.2f} |".format
+    print("\n".join(map(row_format, descriptions, prices, discounts)))
 
 
 # Run main() only when script is executed directly